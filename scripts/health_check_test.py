@@ -11,41 +11,134 @@ Exit codes:
     2: Health check error - Unexpected error during check
 """
 import asyncio
+import base64
 import sys
 import os
-from pathlib import Path
+from typing import Awaitable, Callable, Dict, Sequence
 
-# Add src directory to path for imports
-# Support both Docker (/app/src) and local development paths
-src_path = Path(__file__).parent.parent / 'src'
-sys.path.insert(0, str(src_path.resolve()))
+import httpx
 
 try:
-    from openproject_client import OpenProjectClient
-except ImportError as e:
-    print(f"ERROR: Failed to import OpenProjectClient: {e}", file=sys.stderr)
-    sys.exit(2)
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
 
+# Upper bound for each probe, so a hanging upstream fails fast instead of
+# piling up health check processes across HEALTHCHECK ticks
+HEALTHCHECK_TIMEOUT = float(os.getenv('HEALTHCHECK_TIMEOUT', '3'))
 
-async def check_health() -> dict:
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Create the event loop used to run the health check.
+    
+    Uses uvloop when available and, on Python 3.12+, the eager task factory so
+    coroutines that finish without suspending skip a trip through the scheduler.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    eager_task_factory = getattr(asyncio, 'eager_task_factory', None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    return loop
+
+
+async def _ping() -> dict:
     """
-    Perform health check by testing OpenProject API connection.
+    Request the OpenProject API root using credentials from the environment.
+    
+    Talks to the API directly instead of importing OpenProjectClient, which
+    would pull in config (.env parsing, logging setup, validation) on every
+    probe.
     
     Returns:
-        dict: Health check result containing success status and details
+        dict: Result in the same shape as OpenProjectClient.test_connection()
     """
-    client = OpenProjectClient()
-    try:
-        result = await client.test_connection()
-        return result
-    except Exception as e:
+    if not os.environ.get('OPENPROJECT_URL'):
+        # Local development: fall back to the .env file like config.py does
+        from dotenv import load_dotenv
+        load_dotenv()
+    
+    url = os.environ['OPENPROJECT_URL'].rstrip('/')
+    api_key = os.environ['OPENPROJECT_API_KEY']
+    auth_string = base64.b64encode(f'apikey:{api_key}'.encode()).decode()
+    headers = {
+        "Authorization": f"Basic {auth_string}",
+        "Accept": "application/json",
+        "Host": os.environ.get('OPENPROJECT_HOST_HEADER') or "localhost"
+    }
+    
+    # No per-request timeout: check_health() already bounds each probe
+    async with httpx.AsyncClient(timeout=None) as client:
+        response = await client.get(f"{url}/api/v3/", headers=headers)
+    
+    if response.status_code >= 400:
+        message = f"API request failed: {response.status_code} {response.reason_phrase}"
         return {
             'success': False,
-            'message': f'Health check failed: {str(e)}',
-            'error': str(e)
+            'message': f'Connection failed: {message}',
+            'error': message
         }
-    finally:
-        await client.close()
+    return {
+        'success': True,
+        'message': 'Connection successful',
+        'openproject_version': response.json().get('coreVersion', 'unknown')
+    }
+
+
+# Probes run concurrently by check_health(); each returns a result dict with
+# at least 'success' and 'message' keys
+HEALTH_PROBES: Dict[str, Callable[[], Awaitable[dict]]] = {
+    'openproject': _ping,
+}
+
+
+async def check_health(
+    probes: Dict[str, Callable[[], Awaitable[dict]]] = HEALTH_PROBES,
+    timeout: float = HEALTHCHECK_TIMEOUT
+) -> dict:
+    """
+    Perform health check by running all probes concurrently.
+    
+    Args:
+        probes: Mapping of check name to async probe callable
+        timeout: Seconds each probe may take before it is reported as failed
+    
+    Returns:
+        dict: Health check result containing overall success status and the
+        result of each individual check under 'checks'
+    """
+    names: Sequence[str] = list(probes)
+    results = await asyncio.gather(
+        *(asyncio.wait_for(probes[name](), timeout) for name in names),
+        return_exceptions=True
+    )
+    
+    checks = {}
+    failures = []
+    for name, result in zip(names, results):
+        if isinstance(result, asyncio.TimeoutError):
+            result = {
+                'success': False,
+                'message': f'Health check timed out after {timeout:g}s',
+                'error': 'timeout'
+            }
+        elif isinstance(result, BaseException):
+            # Many httpx errors (e.g. ConnectError) have an empty message
+            error = str(result) or type(result).__name__
+            result = {
+                'success': False,
+                'message': f'Health check failed: {error}',
+                'error': error
+            }
+        checks[name] = result
+        if not result.get('success'):
+            failures.append(f"{name}: {result.get('message', 'Unknown error')}")
+    
+    return {
+        'success': not failures,
+        'message': '; '.join(failures) if failures else 'All checks passed',
+        'checks': checks
+    }
 
 
 def main() -> int:
@@ -56,11 +149,14 @@ def main() -> int:
         int: Exit code (0 for success, 1 for failure, 2 for error)
     """
     try:
-        result = asyncio.run(check_health())
+        # debug=False explicitly, so PYTHONASYNCIODEBUG cannot slow down probes
+        with asyncio.Runner(debug=False, loop_factory=_new_event_loop) as runner:
+            result = runner.run(check_health())
         
         # Print result for logging/debugging
         if result.get('success'):
-            print(f"✓ Health check passed - OpenProject v{result.get('openproject_version', 'unknown')}")
+            version = result['checks']['openproject'].get('openproject_version', 'unknown')
+            print(f"✓ Health check passed - OpenProject v{version}")
         else:
             print(f"✗ Health check failed - {result.get('message', 'Unknown error')}", file=sys.stderr)
         
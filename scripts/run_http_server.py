@@ -6,13 +6,18 @@ This script starts the FastMCP server for OpenProject integration in HTTP mode.
 """
 import sys
 import os
+import importlib.util
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add src directory to path for imports unless it is already importable
+# (the Docker image puts /app/src on PYTHONPATH)
+if importlib.util.find_spec('openproject_client') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 if __name__ == "__main__":
     try:
         from mcp_server import app
+        from utils.event_loop import install_uvloop
+        install_uvloop()
         # Run the FastMCP app in HTTP mode on port 8080
         print("Starting OpenProject MCP Server in HTTP mode on port 8080...")
         app.run(transport="sse", host="0.0.0.0", port=8080)
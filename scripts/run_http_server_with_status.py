@@ -6,14 +6,104 @@ This script starts both the FastMCP server and a simple HTTP status server.
 """
 import sys
 import os
+import importlib.util
 import asyncio
 import json
 import threading
+import time
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
 
-# Add src directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Add src directory to path for imports unless it is already importable
+# (the Docker image puts /app/src on PYTHONPATH)
+if importlib.util.find_spec('openproject_client') is None:
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+# Loopback port for the container liveness probe (see HealthMonitor.start_probe_listener)
+HEALTH_PORT = int(os.environ.get('HEALTH_PORT', '8082'))
+# Seconds between background OpenProject connection checks
+HEALTH_REFRESH_INTERVAL = 15.0
+
+class HealthMonitor:
+    """Runs OpenProject connection checks on a dedicated event loop.
+    
+    The loop and its OpenProjectClient live for the whole process, so repeated
+    probes reuse pooled keep-alive connections instead of paying a new TCP/TLS
+    handshake on every request. A background task refreshes the result every
+    HEALTH_REFRESH_INTERVAL seconds so probes can be answered from memory.
+    """
+    
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._client = None
+        # (time.monotonic() timestamp, result) of the latest connection check
+        self._cached = None
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+    
+    @property
+    def _last_result(self):
+        return self._cached[1] if self._cached is not None else None
+    
+    async def _test_connection(self):
+        try:
+            if self._client is None:
+                # Import here to avoid issues during module loading
+                from openproject_client import OpenProjectClient
+                self._client = OpenProjectClient()
+            result = await self._client.test_connection()
+        except Exception as e:
+            result = {'success': False, 'message': f'Health check failed: {str(e)}'}
+        self._cached = (time.monotonic(), result)
+        return result
+    
+    async def _refresh_health_loop(self, interval: float = HEALTH_REFRESH_INTERVAL):
+        while True:
+            await self._test_connection()
+            await asyncio.sleep(interval)
+    
+    def start_background_refresh(self, interval: float = HEALTH_REFRESH_INTERVAL) -> None:
+        """Keep the cached connection result fresh from the monitor loop."""
+        self._loop.call_soon_threadsafe(
+            lambda: self._loop.create_task(self._refresh_health_loop(interval))
+        )
+    
+    def cached_status(self, max_age: float = 2 * HEALTH_REFRESH_INTERVAL, timeout: float = 10.0) -> dict:
+        """Return the cached connection result, refreshing it only if it is stale."""
+        cached = self._cached
+        if cached is not None and time.monotonic() - cached[0] <= max_age:
+            return cached[1]
+        return self.test_connection(timeout)
+    
+    async def _handle_probe(self, reader, writer):
+        # Answer from memory: accepting the connection is the liveness signal,
+        # the payload is the last known OpenProject connection result
+        result = self._last_result or {'success': False, 'message': 'No connection check has run yet'}
+        writer.write(json.dumps(result).encode() + b'\n')
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+    
+    def start_probe_listener(self, port: int = HEALTH_PORT) -> None:
+        """Start the loopback TCP listener used by the container HEALTHCHECK.
+        
+        A probe is a single socket accept on the already running loop, instead
+        of starting a Python interpreter and importing the client per check.
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle_probe, '127.0.0.1', port), self._loop
+        )
+        future.result()
+        print(f"Starting health probe listener on 127.0.0.1:{port}...")
+    
+    def test_connection(self, timeout: float = 10.0) -> dict:
+        """Test the OpenProject connection from a non-event-loop thread."""
+        future = asyncio.run_coroutine_threadsafe(self._test_connection(), self._loop)
+        return future.result(timeout)
+
+
+health_monitor = HealthMonitor()
+
 
 class StatusHandler(BaseHTTPRequestHandler):
     """HTTP handler for status endpoints."""
@@ -24,6 +114,8 @@ class StatusHandler(BaseHTTPRequestHandler):
         
         if parsed_path.path == '/health':
             self.send_health_response()
+        elif parsed_path.path == '/healthz':
+            self.send_healthz_response()
         elif parsed_path.path == '/':
             self.send_root_response()
         else:
@@ -33,38 +125,25 @@ class StatusHandler(BaseHTTPRequestHandler):
         """Send health check response."""
         try:
             # Import here to avoid issues during module loading
-            from openproject_client import OpenProjectClient
             from config import settings
             
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def check_health():
-                client = OpenProjectClient()
-                try:
-                    connection_result = await client.test_connection()
-                    if connection_result.get('success'):
-                        return {
-                            "status": "healthy",
-                            "message": "OpenProject MCP Server is currently running",
-                            "openproject_connection": "connected",
-                            "openproject_version": connection_result.get('openproject_version', 'unknown'),
-                            "openproject_url": settings.openproject_url
-                        }
-                    else:
-                        return {
-                            "status": "degraded", 
-                            "message": "OpenProject MCP Server is running but OpenProject connection failed",
-                            "openproject_connection": "failed",
-                            "error": connection_result.get('message', 'Unknown connection error'),
-                            "openproject_url": settings.openproject_url
-                        }
-                finally:
-                    await client.close()
-            
-            result = loop.run_until_complete(check_health())
-            loop.close()
+            connection_result = health_monitor.test_connection()
+            if connection_result.get('success'):
+                result = {
+                    "status": "healthy",
+                    "message": "OpenProject MCP Server is currently running",
+                    "openproject_connection": "connected",
+                    "openproject_version": connection_result.get('openproject_version', 'unknown'),
+                    "openproject_url": settings.openproject_url
+                }
+            else:
+                result = {
+                    "status": "degraded", 
+                    "message": "OpenProject MCP Server is running but OpenProject connection failed",
+                    "openproject_connection": "failed",
+                    "error": connection_result.get('message', 'Unknown connection error'),
+                    "openproject_url": settings.openproject_url
+                }
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -85,6 +164,18 @@ class StatusHandler(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(json.dumps(error_result, indent=2).encode())
     
+    def send_healthz_response(self):
+        """Send container health probe response (503 when OpenProject is unreachable)."""
+        try:
+            connection_result = health_monitor.cached_status()
+        except Exception as e:
+            connection_result = {'success': False, 'message': f'Health check failed: {str(e)}'}
+        
+        self.send_response(200 if connection_result.get('success') else 503)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(connection_result).encode())
+    
     def send_root_response(self):
         """Send root endpoint response."""
         result = {
@@ -93,6 +184,7 @@ class StatusHandler(BaseHTTPRequestHandler):
             "message": "OpenProject MCP Server is currently running",
             "endpoints": {
                 "/health": "Health check with OpenProject connection status",
+                "/healthz": "Container health probe (HTTP 503 when OpenProject is unreachable)",
                 "/": "Basic server information"
             },
             "mcp_tools": [
@@ -131,6 +223,8 @@ def run_mcp_server():
     """Run the MCP server."""
     try:
         from mcp_server import app
+        from utils.event_loop import install_uvloop
+        install_uvloop()
         print("Starting OpenProject MCP Server in HTTP mode on port 8080...")
         app.run(transport="sse", host="0.0.0.0", port=8080)
     except ImportError as e:
@@ -142,6 +236,9 @@ def run_mcp_server():
 
 
 if __name__ == "__main__":
+    health_monitor.start_background_refresh()
+    health_monitor.start_probe_listener()
+    
     # Start status server in a separate thread
     status_thread = threading.Thread(target=run_status_server, daemon=True)
     status_thread.start()
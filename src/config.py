@@ -1,51 +1,100 @@
 ﻿"""Configuration management for OpenProject MCP Server."""
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Mapping, NamedTuple, Optional
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file, unless the environment is
+# already populated (e.g. injected by Docker) or loading is explicitly disabled
+if os.getenv("OPENPROJECT_MCP_SKIP_DOTENV") != "1" and not os.getenv("OPENPROJECT_URL"):
+    load_dotenv()
 
-# Configure logging as early as possible
-from utils.logging import configure_logging
-configure_logging(os.getenv("MCP_LOG_LEVEL", "INFO"))
+_LOGGING_CONFIGURED = False
 
+# Validation constants
+_URL_PREFIXES = ("http://", "https://")
+_API_KEY_MIN_LEN = 20
 
-class Settings:
-    """Application settings loaded from environment variables."""
 
-    def __init__(self):
-        # OpenProject configuration
-        self.openproject_url: str = self._get_required_env("OPENPROJECT_URL")
-        self.openproject_api_key: str = self._get_required_env("OPENPROJECT_API_KEY")
-        self.openproject_host_header: Optional[str] = os.getenv("OPENPROJECT_HOST_HEADER")
+def _ensure_logging(log_level: str) -> None:
+    """Configure logging once per process, on first settings access."""
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED:
+        return
+    from utils.logging import configure_logging
+    configure_logging(log_level)
+    _LOGGING_CONFIGURED = True
 
-        # MCP server configuration
-        self.mcp_host: str = os.getenv("MCP_HOST", "localhost")
-        self.mcp_port: int = int(os.getenv("MCP_PORT", "8080"))
-        self.log_level: str = os.getenv("MCP_LOG_LEVEL", "INFO")
 
-        # Validate configuration
-        self._validate_config()
+class Settings(NamedTuple):
+    """Application settings loaded from environment variables.
 
-    def _get_required_env(self, key: str) -> str:
+    Immutable and hashable; build validated instances with ``from_env()``.
+    """
+
+    # OpenProject configuration
+    openproject_url: str
+    openproject_api_key: str
+    openproject_host_header: Optional[str] = None
+    # Seconds to cache rarely changing metadata (types, statuses, priorities)
+    openproject_metadata_ttl: float = 300.0
+
+    # MCP server configuration
+    mcp_host: str = "localhost"
+    mcp_port: int = 8080
+    log_level: str = "INFO"
+    # Indent tool responses; meant for debugging by hand, compact otherwise
+    mcp_pretty_json: bool = False
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str] = os.environ) -> "Settings":
+        """Load and validate settings from environment variables."""
+        settings = cls(
+            openproject_url=cls._get_required_env(env, "OPENPROJECT_URL"),
+            openproject_api_key=cls._get_required_env(env, "OPENPROJECT_API_KEY"),
+            openproject_host_header=env.get("OPENPROJECT_HOST_HEADER"),
+            openproject_metadata_ttl=float(env.get("OPENPROJECT_METADATA_TTL", "300")),
+            mcp_host=env.get("MCP_HOST", "localhost"),
+            mcp_port=int(env.get("MCP_PORT", "8080")),
+            log_level=env.get("MCP_LOG_LEVEL", "INFO"),
+            mcp_pretty_json=env.get("MCP_PRETTY_JSON", "0").lower() in ("1", "true"),
+        )
+        settings._validate_config()
+        return settings
+
+    @staticmethod
+    def _get_required_env(env: Mapping[str, str], key: str) -> str:
         """Get required environment variable or raise error."""
-        value = os.getenv(key)
+        value = env.get(key)
         if not value:
             raise ValueError(f"Required environment variable {key} is not set")
         return value
 
     def _validate_config(self) -> None:
         """Validate configuration values."""
-        if not self.openproject_url.startswith(("http://", "https://")):
+        if not self.openproject_url.startswith(_URL_PREFIXES):
             raise ValueError("OPENPROJECT_URL must start with http:// or https://")
 
-        if len(self.openproject_api_key) < 20:
+        if len(self.openproject_api_key) < _API_KEY_MIN_LEN:
             raise ValueError("OPENPROJECT_API_KEY appears to be too short")
 
+        if self.openproject_metadata_ttl < 0:
+            raise ValueError("OPENPROJECT_METADATA_TTL cannot be negative")
+
         if not (1 <= self.mcp_port <= 65535):
             raise ValueError("MCP_PORT must be between 1 and 65535")
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings instance, creating it on first use."""
+    settings = Settings.from_env()
+    _ensure_logging(settings.log_level)
+    return settings
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve the ``settings`` module attribute lazily via get_settings()."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
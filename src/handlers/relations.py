@@ -0,0 +1,65 @@
+"""Batched creation of work package relations."""
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from openproject_client import OpenProjectClient
+
+# (from_wp_id, to_wp_id, relation_type, description, lag)
+RelationSpec = Tuple[int, int, str, str, int]
+
+
+class RelationBatcher:
+    """Queue relation creation requests and send them to OpenProject in batches.
+    
+    Agents building a Gantt chart tend to create many dependencies at once.
+    Requests that arrive while a batch is in flight are collected and sent
+    together as the next batch (up to ``max_batch_size``), so concurrent calls
+    share the client's connection pool instead of queuing one by one. There is
+    no time-based delay: a lone request is sent immediately.
+    """
+    
+    def __init__(self, client: OpenProjectClient, max_batch_size: int = 25):
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[RelationSpec, asyncio.Future]] = []
+        self._worker: Optional[asyncio.Task] = None
+    
+    async def create(
+        self,
+        from_wp_id: int,
+        to_wp_id: int,
+        relation_type: str = "follows",
+        description: str = "",
+        lag: int = 0
+    ) -> Dict[str, Any]:
+        """Queue a relation for creation and wait for the created relation."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._worker.get_loop() is not loop:
+            # Started from a different event loop; its queue cannot be resumed here
+            self._pending = []
+            self._worker = None
+        
+        future = loop.create_future()
+        self._pending.append(((from_wp_id, to_wp_id, relation_type, description, lag), future))
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._drain())
+        return await future
+    
+    async def _drain(self) -> None:
+        """Send queued relations batch by batch until the queue is empty."""
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            
+            try:
+                results = await self.client.bulk_create_relations([spec for spec, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+            
+            for (_, future), result in zip(batch, results):
+                if future.done():  # Caller was cancelled
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
@@ -1,36 +1,150 @@
 """FastMCP server for OpenProject integration."""
 import asyncio
-import json
-from typing import Dict, Any, Optional, List
+import time
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
+import orjson
 from fastmcp import FastMCP
 from openproject_client import OpenProjectClient, OpenProjectAPIError
 from models import ProjectCreateRequest, WorkPackageCreateRequest, WorkPackageRelationCreateRequest
 from pydantic import ValidationError
 from config import settings
 from handlers.resources import ResourceHandler
+from handlers.relations import RelationBatcher
 from utils.logging import get_logger, log_tool_execution, log_error
+from utils.validation import is_valid_date_format
+from utils.cache import ResponseCache, SingleFlight
 
 logger = get_logger(__name__)
 
 
+# MCP clients parse responses programmatically; only indent when asked to
+# with MCP_PRETTY_JSON=1
+_JSON_OPT = orjson.OPT_NON_STR_KEYS
+if settings.mcp_pretty_json:
+    _JSON_OPT |= orjson.OPT_INDENT_2
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool response as JSON (indented if MCP_PRETTY_JSON is set)."""
+    return orjson.dumps(obj, option=_JSON_OPT).decode()
+
+
+def _pretty_json(obj: Any) -> str:
+    """Serialize data as indented JSON for embedding in prompt text."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _error_response(message: str) -> str:
+    """Serialize a failed tool response with an error message."""
+    return _dump({"success": False, "error": message})
+
+
+# Web UI URL prefixes for links in tool responses
+_WP_URL = f"{settings.openproject_url}/work_packages/"
+_PROJECT_URL = f"{settings.openproject_url}/projects/"
+_RELATION_URL = f"{settings.openproject_url}/relations/"
+
+# Shared fallback for missing HAL sections; never mutated
+_EMPTY: Dict[str, Any] = {}
+
+
+def _hal_title(resource: Dict[str, Any], link: str, default: str = "Unknown") -> str:
+    """Return the title of a HAL link, e.g. a work package's status name."""
+    links = resource.get("_links") or _EMPTY
+    return (links.get(link) or _EMPTY).get("title", default)
+
+
+def _href_id(href: str) -> str:
+    """Return the trailing ID segment of a HAL link href."""
+    return href[href.rfind("/") + 1:]
+
+
+def _preview(text: str, limit: int = 200) -> str:
+    """Truncate text for list previews, returning short strings unchanged."""
+    return text if len(text) <= limit else text[:limit]
+
+
+# Static error responses, serialized once at import
+_ERR_WP_ID_POS = _error_response("Work package ID must be a positive integer")
+_ERR_PROJECT_ID_POS = _error_response("Project ID must be a positive integer")
+_ERR_RELATION_ID_POS = _error_response("Relation ID must be a positive integer")
+_ERR_START_DATE_FORMAT = _error_response("Start date must be in YYYY-MM-DD format")
+_ERR_DUE_DATE_FORMAT = _error_response("Due date must be in YYYY-MM-DD format")
+_CUSTOM_FILTERS_NOT_ARRAY = _error_response("custom_filters must be a JSON array")
+
+
+# Read-heavy list tools are served from here for a short time; entries stay
+# usable as a fallback while OpenProject is returning errors
+_response_cache = ResponseCache(ttl=30.0, stale_ttl=300.0)
+
+# Identical concurrent read calls share one OpenProject request
+_inflight = SingleFlight()
+
+
+def _stale_response(cache_key: tuple, error: OpenProjectAPIError) -> Optional[str]:
+    """Return the last cached response for a key, marked as stale, if any.
+    
+    Only outages fall back to stale data: transport errors (no status code),
+    429 and 5xx. Auth, not-found and validation errors are reported as-is.
+    """
+    status = error.status_code
+    if status is not None and status != 429 and status < 500:
+        return None
+    payload = _response_cache.get_stale(cache_key)
+    if payload is None:
+        return None
+    return _dump({**orjson.loads(payload), "cache": "stale"})
+
+
 # Initialize FastMCP server with minimal output
 import os
 os.environ['FASTMCP_QUIET'] = '1'  # Try to suppress FastMCP banner
-app = FastMCP("OpenProject MCP Server")
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Close the shared OpenProject HTTP client when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await openproject_client.close()
+
+
+app = FastMCP("OpenProject MCP Server", lifespan=lifespan)
 
 # Initialize OpenProject client and resource handler
 openproject_client = OpenProjectClient()
 resource_handler = ResourceHandler(openproject_client)
+relation_batcher = RelationBatcher(openproject_client)
+
+
+# health_check responses are cached briefly so repeated pings skip the API
+# round-trip; failures are kept for a shorter time so recovery shows up quickly
+_HEALTH_CACHE_TTL = 5.0
+_HEALTH_FAILURE_CACHE_TTL = 1.0
+_health_cache: Optional[Tuple[float, str]] = None  # (expires_at, response)
 
 
 # Add health check tool for MCP
 @app.tool()
-async def health_check() -> str:
+async def health_check(force: bool = False) -> str:
     """Health check tool to verify OpenProject MCP Server is running and connected.
     
+    Args:
+        force: Bypass the short-lived cached result and check the connection now
+    
     Returns:
         JSON string with server and OpenProject connection status
     """
+    global _health_cache
+    now = time.monotonic()
+    if not force and _health_cache is not None and now < _health_cache[0]:
+        return _health_cache[1]
+    
     try:
         # Test OpenProject connection
         connection_result = await openproject_client.test_connection()
@@ -53,7 +167,8 @@ async def health_check() -> str:
             }
         
         log_tool_execution(logger, "health_check", True, result=result)
-        return json.dumps(result, indent=2)
+        response = _dump(result)
+        ttl = _HEALTH_CACHE_TTL if connection_result.get('success') else _HEALTH_FAILURE_CACHE_TTL
         
     except Exception as e:
         error_result = {
@@ -62,7 +177,11 @@ async def health_check() -> str:
             "error": str(e)
         }
         log_error(logger, e, {"tool": "health_check"})
-        return json.dumps(error_result, indent=2)
+        response = _dump(error_result)
+        ttl = _HEALTH_FAILURE_CACHE_TTL
+    
+    _health_cache = (now + ttl, response)
+    return response
 
 
 @app.tool()
@@ -80,10 +199,7 @@ async def create_project(name: str, description: str = "", status: str = "active
     try:
         # Validate input
         if not name or not name.strip():
-            return json.dumps({
-                "success": False,
-                "error": "Project name is required and cannot be empty"
-            })
+            return _error_response("Project name is required and cannot be empty")
         
         # Create project request
         project_request = ProjectCreateRequest(
@@ -94,8 +210,9 @@ async def create_project(name: str, description: str = "", status: str = "active
         
         # Call OpenProject API
         result = await openproject_client.create_project(project_request)
+        _response_cache.invalidate("get_projects")
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Project '{name}' created successfully",
             "project": {
@@ -103,21 +220,21 @@ async def create_project(name: str, description: str = "", status: str = "active
                 "name": result.get("name"),
                 "description": result.get("description", {}).get("raw", ""),
                 "status": result.get("status"),
-                "url": f"{settings.openproject_url}/projects/{result.get('identifier', result.get('id'))}"
+                "url": f"{_PROJECT_URL}{result.get('identifier', result.get('id'))}"
             }
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -149,36 +266,10 @@ async def create_work_package(
         JSON string with work package creation result
     """
     try:
-        # Validate input
-        if not subject or not subject.strip():
-            return json.dumps({
-                "success": False,
-                "error": "Work package subject is required and cannot be empty"
-            })
-        
-        if project_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Project ID must be a positive integer"
-            })
-        
-        # Validate date format if provided
-        if start_date and not _is_valid_date_format(start_date):
-            return json.dumps({
-                "success": False,
-                "error": "Start date must be in YYYY-MM-DD format"
-            })
-        
-        if due_date and not _is_valid_date_format(due_date):
-            return json.dumps({
-                "success": False,
-                "error": "Due date must be in YYYY-MM-DD format"
-            })
-        
-        # Create work package request
+        # Create and validate work package request using Pydantic model
         wp_request = WorkPackageCreateRequest(
             project_id=project_id,
-            subject=subject.strip(),
+            subject=subject,
             description=description.strip() if description else "",
             type_id=type_id,
             start_date=start_date,
@@ -190,10 +281,11 @@ async def create_work_package(
         
         # Call OpenProject API
         result = await openproject_client.create_work_package(wp_request)
+        _response_cache.invalidate("get_work_packages", project_id)
         
-        return json.dumps({
+        return _dump({
             "success": True,
-            "message": f"Work package '{subject}' created successfully",
+            "message": f"Work package '{wp_request.subject}' created successfully",
             "work_package": {
                 "id": result.get("id"),
                 "subject": result.get("subject"),
@@ -201,28 +293,95 @@ async def create_work_package(
                 "project_id": project_id,
                 "start_date": result.get("startDate"),
                 "due_date": result.get("dueDate"),
-                "status": result.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "url": f"{settings.openproject_url}/work_packages/{result.get('id')}"
+                "status": _hal_title(result, "status"),
+                "url": f"{_WP_URL}{result.get('id')}"
             }
-        }, indent=2)
+        })
         
     except ValidationError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": "Validation error",
             "details": [{"field": err["loc"][-1], "message": err["msg"]} for err in e.errors()]
-        }, indent=2)
+        })
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
+    except Exception as e:
+        return _dump({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        })
+
+
+@app.tool()
+async def create_work_packages(work_packages: List[Dict[str, Any]]) -> str:
+    """Create several work packages at once, e.g. all tasks of a project plan.
+    
+    Work packages are created concurrently. A work package that fails
+    validation or is rejected by OpenProject does not stop the others.
+    
+    Args:
+        work_packages: Work packages to create, each with the same fields as
+            create_work_package (project_id and subject are required)
+    
+    Returns:
+        JSON string with one result per work package, in input order
+    """
+    try:
+        results: List[Optional[Dict[str, Any]]] = [None] * len(work_packages)
+        requests: List[Tuple[int, WorkPackageCreateRequest]] = []
+        for index, item in enumerate(work_packages):
+            try:
+                requests.append((index, WorkPackageCreateRequest(**item)))
+            except ValidationError as e:
+                results[index] = {
+                    "success": False,
+                    "error": "Validation error",
+                    "details": [{"field": err["loc"][-1], "message": err["msg"]} for err in e.errors()]
+                }
+        
+        created = await openproject_client.bulk_create_work_packages([wp for _, wp in requests])
+        for (index, wp_request), result in zip(requests, created):
+            if isinstance(result, OpenProjectAPIError):
+                results[index] = {
+                    "success": False,
+                    "error": f"OpenProject API error: {result.message}",
+                    "details": result.response_data
+                }
+            elif isinstance(result, Exception):
+                results[index] = {"success": False, "error": f"Unexpected error: {str(result)}"}
+            else:
+                results[index] = {
+                    "success": True,
+                    "work_package": {
+                        "id": result.get("id"),
+                        "subject": result.get("subject"),
+                        "project_id": wp_request.project_id,
+                        "start_date": result.get("startDate"),
+                        "due_date": result.get("dueDate"),
+                        "url": f"{_WP_URL}{result.get('id')}"
+                    }
+                }
+        
+        for project_id in {wp.project_id for _, wp in requests}:
+            _response_cache.invalidate("get_work_packages", project_id)
+        
+        created_count = sum(1 for result in results if result["success"])
+        return _dump({
+            "success": created_count == len(results),
+            "message": f"Created {created_count} of {len(results)} work packages",
+            "results": results
+        })
+        
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -231,16 +390,21 @@ async def create_work_package_dependency(
     to_work_package_id: int,
     relation_type: str = "follows",
     description: str = "",
-    lag: int = 0
+    lag: int = 0,
+    flush_now: bool = False
 ) -> str:
     """Create a dependency between two work packages for Gantt chart visualization.
     
+    Concurrent calls are batched together; set flush_now to send this relation
+    on its own right away.
+    
     Args:
         from_work_package_id: ID of the work package that comes first
         to_work_package_id: ID of the work package that depends on the first
         relation_type: Type of relation (follows, precedes, blocks, blocked, relates, duplicates, duplicated)
         description: Optional description of the relation
         lag: Working days between finish of predecessor and start of successor (default: 0)
+        flush_now: Bypass the batch queue (default: False)
     
     Returns:
         JSON string with relation creation result
@@ -256,7 +420,11 @@ async def create_work_package_dependency(
         )
         
         # Call OpenProject API
-        result = await openproject_client.create_work_package_relation(
+        create_relation = (
+            openproject_client.create_work_package_relation if flush_now
+            else relation_batcher.create
+        )
+        result = await create_relation(
             relation_request.from_work_package_id, 
             relation_request.to_work_package_id, 
             relation_request.relation_type, 
@@ -273,32 +441,32 @@ async def create_work_package_dependency(
             "reverse_type": result.get("reverseType"),
             "description": result.get("description", description),
             "lag": result.get("lag", lag),
-            "url": f"{settings.openproject_url}/relations/{result.get('id')}" if result.get('id') else None
+            "url": f"{_RELATION_URL}{result['id']}" if result.get('id') else None
         }
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Relation created: Work package {from_work_package_id} {relation_type} work package {to_work_package_id}",
             "relation": relation_data
-        }, indent=2)
+        })
         
     except ValidationError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": "Validation error",
             "details": [{"field": err["loc"][-1], "message": err["msg"]} for err in e.errors()]
-        }, indent=2)
+        })
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -313,54 +481,57 @@ async def get_work_package_relations(work_package_id: int) -> str:
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Work package ID must be a positive integer"
-            })
+            return _ERR_WP_ID_POS
         
-        relations = await openproject_client.get_work_package_relations(work_package_id)
+        relations = await _inflight.do(
+            ("get_work_package_relations", work_package_id),
+            lambda: openproject_client.get_work_package_relations(work_package_id)
+        )
         
         relation_list = []
+        append = relation_list.append
         for relation in relations:
             # Extract linked work packages info
-            from_wp = relation.get("_links", {}).get("from", {})
-            to_wp = relation.get("_links", {}).get("to", {})
+            links = relation.get("_links") or _EMPTY
+            from_wp = links.get("from") or _EMPTY
+            to_wp = links.get("to") or _EMPTY
+            from_href = from_wp.get("href")
+            to_href = to_wp.get("href")
             
-            relation_data = {
+            append({
                 "id": relation.get("id"),
                 "type": relation.get("type"),
                 "reverse_type": relation.get("reverseType"),
                 "description": relation.get("description", ""),
                 "lag": relation.get("lag", 0),
                 "from_work_package": {
-                    "id": from_wp.get("href", "").split("/")[-1] if from_wp.get("href") else None,
+                    "id": _href_id(from_href) if from_href else None,
                     "title": from_wp.get("title", "Unknown")
                 },
                 "to_work_package": {
-                    "id": to_wp.get("href", "").split("/")[-1] if to_wp.get("href") else None,
+                    "id": _href_id(to_href) if to_href else None,
                     "title": to_wp.get("title", "Unknown")
                 }
-            }
-            relation_list.append(relation_data)
+            })
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(relation_list)} relations for work package {work_package_id}",
             "work_package_id": work_package_id,
             "relations": relation_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -375,29 +546,38 @@ async def delete_work_package_relation(relation_id: int) -> str:
     """
     try:
         if relation_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Relation ID must be a positive integer"
-            })
+            return _ERR_RELATION_ID_POS
         
         await openproject_client.delete_work_package_relation(relation_id)
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Relation {relation_id} deleted successfully"
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
+
+
+def _format_project(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a project for list and resource responses."""
+    return {
+        "id": project.get("id"),
+        "name": project.get("name"),
+        "description": (project.get("description") or _EMPTY).get("raw", ""),
+        "status": project.get("status"),
+        "identifier": project.get("identifier"),
+        "url": f"{_PROJECT_URL}{project.get('identifier', project.get('id'))}"
+    }
 
 
 @app.tool()
@@ -407,37 +587,37 @@ async def get_projects() -> str:
     Returns:
         JSON string with list of projects
     """
+    cache_key = ("get_projects",)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        projects = await openproject_client.get_projects()
+        # The token keys the shared fetch too, so calls made after an
+        # invalidation do not join a fetch that started before it
+        token = _response_cache.token()
+        projects = await _inflight.do((*cache_key, token), openproject_client.get_projects)
         
-        project_list = []
-        for project in projects:
-            project_list.append({
-                "id": project.get("id"),
-                "name": project.get("name"),
-                "description": project.get("description", {}).get("raw", ""),
-                "status": project.get("status"),
-                "identifier": project.get("identifier"),
-                "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
-            })
-        
-        return json.dumps({
+        return _response_cache.set(cache_key, _dump({
             "success": True,
-            "message": f"Found {len(project_list)} projects",
-            "projects": project_list
-        }, indent=2)
+            "message": f"Found {len(projects)} projects",
+            "projects": [_format_project(project) for project in projects]
+        }), token)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        stale = _stale_response(cache_key, e)
+        if stale is not None:
+            return stale
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -452,44 +632,55 @@ async def get_work_packages(project_id: int) -> str:
     """
     try:
         if project_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Project ID must be a positive integer"
-            })
+            return _ERR_PROJECT_ID_POS
         
-        work_packages = await openproject_client.get_work_packages(project_id)
+        cache_key = ("get_work_packages", project_id)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        token = _response_cache.token()
+        work_packages = await _inflight.do(
+            (*cache_key, token), lambda: openproject_client.get_work_packages(project_id)
+        )
         
         wp_list = []
+        append = wp_list.append
         for wp in work_packages:
-            wp_list.append({
-                "id": wp.get("id"),
+            links = wp.get("_links") or _EMPTY
+            wp_id = wp.get("id")
+            append({
+                "id": wp_id,
                 "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", ""),
+                "description": (wp.get("description") or _EMPTY).get("raw", ""),
                 "project_id": project_id,
                 "start_date": wp.get("startDate"),
                 "due_date": wp.get("dueDate"),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                "status": (links.get("status") or _EMPTY).get("title", "Unknown"),
+                "assignee": (links.get("assignee") or _EMPTY).get("title", "Unassigned"),
+                "url": f"{_WP_URL}{wp_id}"
             })
         
-        return json.dumps({
+        return _response_cache.set(cache_key, _dump({
             "success": True,
             "message": f"Found {len(wp_list)} work packages in project {project_id}",
             "work_packages": wp_list
-        }, indent=2)
+        }), token)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        stale = _stale_response(("get_work_packages", project_id), e)
+        if stale is not None:
+            return stale
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -546,29 +737,21 @@ async def search_work_packages(
     """
     try:
         # Build filter summary early for error handling
-        filters_applied = {}
-        if project_id:
-            filters_applied["project_id"] = project_id
-        if status_ids:
-            filters_applied["status_ids"] = status_ids
-        if assignee_id:
-            filters_applied["assignee_id"] = assignee_id
-        if type_ids:
-            filters_applied["type_ids"] = type_ids
-        if priority_ids:
-            filters_applied["priority_ids"] = priority_ids
-        if created_after:
-            filters_applied["created_after"] = created_after
-        if created_before:
-            filters_applied["created_before"] = created_before
-        if due_after:
-            filters_applied["due_after"] = due_after
-        if due_before:
-            filters_applied["due_before"] = due_before
-        if subject_contains:
-            filters_applied["subject_contains"] = subject_contains
-        if custom_filters:
-            filters_applied["custom_filters"] = custom_filters
+        filters_applied = {
+            name: value for name, value in (
+                ("project_id", project_id),
+                ("status_ids", status_ids),
+                ("assignee_id", assignee_id),
+                ("type_ids", type_ids),
+                ("priority_ids", priority_ids),
+                ("created_after", created_after),
+                ("created_before", created_before),
+                ("due_after", due_after),
+                ("due_before", due_before),
+                ("subject_contains", subject_contains),
+                ("custom_filters", custom_filters),
+            ) if value
+        }
         
         # Validate date formats
         date_params = [
@@ -578,43 +761,28 @@ async def search_work_packages(
             ("due_before", due_before)
         ]
         for param_name, param_value in date_params:
-            if param_value and not _is_valid_date_format(param_value):
-                return json.dumps({
-                    "success": False,
-                    "error": f"Invalid date format for {param_name}: {param_value}. Use YYYY-MM-DD format."
-                })
+            if param_value and not is_valid_date_format(param_value):
+                return _error_response(f"Invalid date format for {param_name}: {param_value}. Use YYYY-MM-DD format.")
         
         # Validate pagination parameters
         if page_size is not None and (page_size < 1 or page_size > 100):
-            return json.dumps({
-                "success": False,
-                "error": "page_size must be between 1 and 100"
-            })
+            return _error_response("page_size must be between 1 and 100")
         
         if offset is not None and offset < 0:
-            return json.dumps({
-                "success": False,
-                "error": "offset must be non-negative"
-            })
+            return _error_response("offset must be non-negative")
         
         # Parse custom_filters if provided
         parsed_custom_filters = None
         if custom_filters:
             try:
-                parsed_custom_filters = json.loads(custom_filters)
+                parsed_custom_filters = orjson.loads(custom_filters)
                 if not isinstance(parsed_custom_filters, list):
-                    return json.dumps({
-                        "success": False,
-                        "error": "custom_filters must be a JSON array"
-                    })
-            except json.JSONDecodeError as e:
-                return json.dumps({
-                    "success": False,
-                    "error": f"Invalid JSON in custom_filters: {str(e)}"
-                })
+                    return _CUSTOM_FILTERS_NOT_ARRAY
+            except orjson.JSONDecodeError as e:
+                return _error_response(f"Invalid JSON in custom_filters: {str(e)}")
         
         # Call search method
-        response = await openproject_client.search_work_packages(
+        search_params = dict(
             project_id=project_id,
             status_ids=status_ids,
             assignee_id=assignee_id,
@@ -631,30 +799,37 @@ async def search_work_packages(
             page_size=page_size or 100,
             offset=offset or 0
         )
+        response = await _inflight.do(
+            ("search_work_packages", orjson.dumps(search_params)),
+            lambda: openproject_client.search_work_packages(**search_params)
+        )
         
         work_packages = response.get("_embedded", {}).get("elements", [])
         total = response.get("total", 0)
         
         # Build work package list
         wp_list = []
+        append = wp_list.append
         for wp in work_packages:
-            wp_list.append({
-                "id": wp.get("id"),
+            links = wp.get("_links") or _EMPTY
+            wp_id = wp.get("id")
+            append({
+                "id": wp_id,
                 "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", "")[:200],  # Truncate
-                "project_id": wp.get("_links", {}).get("project", {}).get("href", "").split("/")[-1],
-                "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
+                "description": _preview((wp.get("description") or _EMPTY).get("raw") or ""),
+                "project_id": _href_id((links.get("project") or _EMPTY).get("href", "")),
+                "type": (links.get("type") or _EMPTY).get("title", "Unknown"),
+                "status": (links.get("status") or _EMPTY).get("title", "Unknown"),
+                "priority": (links.get("priority") or _EMPTY).get("title", "Unknown"),
+                "assignee": (links.get("assignee") or _EMPTY).get("title", "Unassigned"),
                 "created_at": wp.get("createdAt"),
                 "updated_at": wp.get("updatedAt"),
                 "start_date": wp.get("startDate"),
                 "due_date": wp.get("dueDate"),
-                "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                "url": f"{_WP_URL}{wp_id}"
             })
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {total} work package(s) matching filters",
             "total": total,
@@ -670,21 +845,21 @@ async def search_work_packages(
                 "has_more": (offset or 0) + len(wp_list) < total
             },
             "work_packages": wp_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
         log_error(logger, e, {"tool": "search_work_packages", "filters": filters_applied})
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
         log_error(logger, e, {"tool": "search_work_packages"})
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -717,26 +892,11 @@ async def update_work_package(
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Work package ID must be a positive integer"
-            })
-        
-        # First, fetch the current work package to get the lockVersion
-        # This is required by OpenProject's optimistic locking mechanism
-        current_wp = await openproject_client.get_work_package_by_id(work_package_id)
-        lock_version = current_wp.get("lockVersion")
-        
-        if lock_version is None:
-            return json.dumps({
-                "success": False,
-                "error": "Unable to retrieve lock version for work package. It may not exist."
-            })
+            return _ERR_WP_ID_POS
         
-        # Build update payload with only provided fields
-        updates = {
-            "lockVersion": lock_version  # Required for optimistic locking
-        }
+        # Build update payload with only provided fields; the client adds the
+        # lockVersion required by OpenProject's optimistic locking
+        updates = {}
         
         if subject:
             updates["subject"] = subject.strip()
@@ -749,19 +909,13 @@ async def update_work_package(
             updates["_links"]["type"] = {"href": f"/api/v3/types/{type_id}"}
         
         if start_date:
-            if not _is_valid_date_format(start_date):
-                return json.dumps({
-                    "success": False,
-                    "error": "Start date must be in YYYY-MM-DD format"
-                })
+            if not is_valid_date_format(start_date):
+                return _ERR_START_DATE_FORMAT
             updates["startDate"] = start_date
         
         if due_date:
-            if not _is_valid_date_format(due_date):
-                return json.dumps({
-                    "success": False,
-                    "error": "Due date must be in YYYY-MM-DD format"
-                })
+            if not is_valid_date_format(due_date):
+                return _ERR_DUE_DATE_FORMAT
             updates["dueDate"] = due_date
         
         if assignee_id:
@@ -775,16 +929,14 @@ async def update_work_package(
         if estimated_hours:
             updates["estimatedTime"] = f"PT{estimated_hours}H"
         
-        # Check if any actual updates were provided (besides lockVersion)
-        if len(updates) == 1:
-            return json.dumps({
-                "success": False,
-                "error": "No updates provided. Specify at least one field to update."
-            })
+        # Check if any actual updates were provided
+        if not updates:
+            return _error_response("No updates provided. Specify at least one field to update.")
         
         result = await openproject_client.update_work_package(work_package_id, updates)
+        _response_cache.invalidate("get_work_packages")
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Work package {work_package_id} updated successfully",
             "work_package": {
@@ -793,22 +945,22 @@ async def update_work_package(
                 "description": result.get("description", {}).get("raw", ""),
                 "start_date": result.get("startDate"),
                 "due_date": result.get("dueDate"),
-                "status": result.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "url": f"{settings.openproject_url}/work_packages/{result.get('id')}"
+                "status": _hal_title(result, "status"),
+                "url": f"{_WP_URL}{result.get('id')}"
             }
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -824,41 +976,35 @@ async def add_work_package_comment(work_package_id: int, comment: str) -> str:
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Work package ID must be a positive integer"
-            })
+            return _ERR_WP_ID_POS
             
         if not comment or not comment.strip():
-            return json.dumps({
-                "success": False,
-                "error": "Comment cannot be empty"
-            })
+            return _error_response("Comment cannot be empty")
         
         # Use the dedicated client method
         result = await openproject_client.add_work_package_comment(work_package_id, comment.strip())
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Comment added to work package {work_package_id}",
             "work_package": {
                 "id": result.get("id"),
                 "subject": result.get("subject"),
-                "url": f"{settings.openproject_url}/work_packages/{result.get('id')}/activity"
+                "url": f"{_WP_URL}{result.get('id')}/activity"
             }
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -887,49 +1033,41 @@ async def get_work_package_activities(work_package_id: int) -> str:
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Work package ID must be a positive integer"
-            })
+            return _ERR_WP_ID_POS
         
         activities = await openproject_client.get_work_package_activities(work_package_id)
         
-        activity_list = []
-        for activity in activities:
-            # Extract user information
-            user_link = activity.get("_links", {}).get("user", {})
-            user_name = user_link.get("title", "Unknown")
-            
-            # Extract activity details
-            activity_data = {
+        activity_list = [
+            {
                 "id": activity.get("id"),
                 "version": activity.get("version"),
-                "comment": activity.get("comment", {}).get("raw", ""),
+                "comment": (activity.get("comment") or _EMPTY).get("raw", ""),
                 "details": activity.get("details", []),
                 "created_at": activity.get("createdAt"),
-                "user": user_name
+                "user": _hal_title(activity, "user")
             }
-            activity_list.append(activity_data)
+            for activity in activities
+        ]
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(activity_list)} activities for work package {work_package_id}",
             "work_package_id": work_package_id,
             "activities": activity_list,
-            "url": f"{settings.openproject_url}/work_packages/{work_package_id}/activity"
-        }, indent=2)
+            "url": f"{_WP_URL}{work_package_id}/activity"
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -945,14 +1083,12 @@ async def get_users(email_filter: Optional[str] = None) -> str:
     try:
         filters = None
         if email_filter:
-            # OpenProject API filter format for email search
-            filters = {"filters": f'[{{"email": {{"operator": "=", "values": ["{email_filter}"]}}}}]'}
+            filters = openproject_client.email_filter_params(email_filter)
         
         users = await openproject_client.get_users(filters)
         
-        user_list = []
-        for user in users:
-            user_list.append({
+        user_list = [
+            {
                 "id": user.get("id"),
                 "name": user.get("name"),
                 "firstName": user.get("firstName", ""),
@@ -964,25 +1100,27 @@ async def get_users(email_filter: Optional[str] = None) -> str:
                 "admin": user.get("admin", False),
                 "created_at": user.get("createdAt", ""),
                 "updated_at": user.get("updatedAt", "")
-            })
+            }
+            for user in users
+        ]
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(user_list)} users" + (f" matching email '{email_filter}'" if email_filter else ""),
             "users": user_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -998,38 +1136,26 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Work package ID must be a positive integer"
-            })
+            return _ERR_WP_ID_POS
         
         if not assignee_email or "@" not in assignee_email:
-            return json.dumps({
-                "success": False,
-                "error": "Valid email address is required"
-            })
-        
-        # Find user by email
-        user = await openproject_client.get_user_by_email(assignee_email)
+            return _error_response("Valid email address is required")
+        
+        # Find user by email while loading the work package's lockVersion.
+        # The prefetch is best-effort: update_work_package() retries the
+        # lookup itself if it failed.
+        user, _ = await asyncio.gather(
+            openproject_client.get_user_by_email(assignee_email),
+            openproject_client.prefetch_lock_version(work_package_id),
+            return_exceptions=True
+        )
+        if isinstance(user, BaseException):
+            raise user
         if not user:
-            return json.dumps({
-                "success": False,
-                "error": f"User with email '{assignee_email}' not found"
-            })
-        
-        # First, fetch the current work package to get the lockVersion
-        current_wp = await openproject_client.get_work_package_by_id(work_package_id)
-        lock_version = current_wp.get("lockVersion")
+            return _error_response(f"User with email '{assignee_email}' not found")
         
-        if lock_version is None:
-            return json.dumps({
-                "success": False,
-                "error": "Unable to retrieve lock version for work package"
-            })
-        
-        # Update work package with assignee and lockVersion
+        # Update work package with assignee; the client adds the lockVersion
         updates = {
-            "lockVersion": lock_version,
             "_links": {
                 "assignee": {
                     "href": f"/api/v3/users/{user.get('id')}"
@@ -1038,8 +1164,9 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
         }
         
         result = await openproject_client.update_work_package(work_package_id, updates)
+        _response_cache.invalidate("get_work_packages")
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Work package {work_package_id} assigned to {user.get('name', assignee_email)}",
             "work_package": {
@@ -1050,21 +1177,48 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
                     "name": user.get("name"),
                     "email": user.get("email")
                 },
-                "url": f"{settings.openproject_url}/work_packages/{result.get('id')}"
+                "url": f"{_WP_URL}{result.get('id')}"
             }
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
+
+
+def _format_membership(membership: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a HAL+JSON membership into user info and role names."""
+    links = membership.get("_links") or _EMPTY
+    user_link = links.get("principal") or _EMPTY
+    roles = links.get("roles", [])
+    user_href = user_link.get("href")
+    
+    # Extract role names
+    if isinstance(roles, list):
+        role_names = [role.get("title", "Unknown Role") for role in roles]
+    elif isinstance(roles, dict):
+        role_names = [roles.get("title", "Unknown Role")]
+    else:
+        role_names = []
+    
+    return {
+        "id": membership.get("id"),
+        "user": {
+            "id": _href_id(user_href) if user_href else None,
+            "title": user_link.get("title", "Unknown User")
+        },
+        "roles": role_names,
+        "created_at": membership.get("createdAt", ""),
+        "updated_at": membership.get("updatedAt", "")
+    }
 
 
 @app.tool()
@@ -1079,59 +1233,28 @@ async def get_project_members(project_id: int) -> str:
     """
     try:
         if project_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Project ID must be a positive integer"
-            })
+            return _ERR_PROJECT_ID_POS
         
         memberships = await openproject_client.get_project_memberships(project_id)
         
-        member_list = []
-        for membership in memberships:
-            # Extract user and role information from HAL+JSON structure
-            user_link = membership.get("_links", {}).get("principal", {})
-            roles = membership.get("_links", {}).get("roles", [])
-            
-            # Get user details if available
-            user_info = {
-                "id": user_link.get("href", "").split("/")[-1] if user_link.get("href") else None,
-                "title": user_link.get("title", "Unknown User")
-            }
-            
-            # Extract role names
-            role_names = []
-            if isinstance(roles, list):
-                role_names = [role.get("title", "Unknown Role") for role in roles]
-            elif isinstance(roles, dict):
-                role_names = [roles.get("title", "Unknown Role")]
-            
-            member_data = {
-                "id": membership.get("id"),
-                "user": user_info,
-                "roles": role_names,
-                "created_at": membership.get("createdAt", ""),
-                "updated_at": membership.get("updatedAt", "")
-            }
-            member_list.append(member_data)
-        
-        return json.dumps({
+        return _dump({
             "success": True,
-            "message": f"Found {len(member_list)} members in project {project_id}",
+            "message": f"Found {len(memberships)} members in project {project_id}",
             "project_id": project_id,
-            "members": member_list
-        }, indent=2)
+            "members": [_format_membership(membership) for membership in memberships]
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -1144,34 +1267,35 @@ async def get_work_package_types() -> str:
     try:
         types = await openproject_client.get_work_package_types()
         
-        type_list = []
-        for wp_type in types:
-            type_list.append({
+        type_list = [
+            {
                 "id": wp_type.get("id"),
                 "name": wp_type.get("name"),
                 "description": wp_type.get("description", ""),
                 "position": wp_type.get("position", 0),
                 "is_default": wp_type.get("isDefault", False),
                 "is_milestone": wp_type.get("isMilestone", False)
-            })
+            }
+            for wp_type in types
+        ]
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(type_list)} work package types",
             "types": type_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -1184,9 +1308,8 @@ async def get_work_package_statuses() -> str:
     try:
         statuses = await openproject_client.get_work_package_statuses()
         
-        status_list = []
-        for status in statuses:
-            status_list.append({
+        status_list = [
+            {
                 "id": status.get("id"),
                 "name": status.get("name"),
                 "description": status.get("description", ""),
@@ -1194,25 +1317,27 @@ async def get_work_package_statuses() -> str:
                 "is_default": status.get("isDefault", False),
                 "is_closed": status.get("isClosed", False),
                 "is_readonly": status.get("isReadonly", False)
-            })
+            }
+            for status in statuses
+        ]
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(status_list)} work package statuses",
             "statuses": status_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
 
 
 @app.tool()
@@ -1225,34 +1350,114 @@ async def get_priorities() -> str:
     try:
         priorities = await openproject_client.get_priorities()
         
-        priority_list = []
-        for priority in priorities:
-            priority_list.append({
+        priority_list = [
+            {
                 "id": priority.get("id"),
                 "name": priority.get("name"),
                 "description": priority.get("description", ""),
                 "position": priority.get("position", 0),
                 "is_default": priority.get("isDefault", False),
                 "is_active": priority.get("isActive", True)
-            })
+            }
+            for priority in priorities
+        ]
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "message": f"Found {len(priority_list)} priorities",
             "priorities": priority_list
-        }, indent=2)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
+        })
+
+
+def _summarize_work_packages(
+    work_packages: List[Dict[str, Any]],
+    status_counts: Counter
+) -> Tuple[int, int, int]:
+    """Count a batch of work packages in a single pass.
+    
+    Statuses are added to ``status_counts``.
+    
+    Returns:
+        (total, with_dates, assigned)
+    """
+    with_dates = 0
+    assigned = 0
+    for wp in work_packages:
+        get = wp.get
+        links = get("_links") or _EMPTY
+        if get("startDate") or get("dueDate"):
+            with_dates += 1
+        if links.get("assignee"):
+            assigned += 1
+        status_counts[(links.get("status") or _EMPTY).get("title", "Unknown")] += 1
+    return len(work_packages), with_dates, assigned
+
+
+# Work package fields read by _summarize_work_packages() and the report sample
+_SUMMARY_FIELDS = ("id", "subject", "startDate", "dueDate", "status", "assignee")
+
+
+async def _fetch_project_summary(
+    project_id: int,
+    sample_size: int = 0
+) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]]]:
+    """Fetch a project and summarize its work packages page by page.
+    
+    Pages are folded into the counts as they arrive instead of being loaded
+    into one list; only the first ``sample_size`` work packages are kept.
+    
+    Returns:
+        (project, summary, sample); project is None if it does not exist, in
+        which case a failed work package fetch is not an error
+    """
+    project_task = asyncio.ensure_future(openproject_client.get_project_by_id(project_id))
+    total = with_dates = assigned = 0
+    status_counts = Counter()
+    sample: List[Dict[str, Any]] = []
+    try:
+        async for page in openproject_client.iter_work_packages(project_id, fields=_SUMMARY_FIELDS):
+            page_total, page_with_dates, page_assigned = _summarize_work_packages(page, status_counts)
+            total += page_total
+            with_dates += page_with_dates
+            assigned += page_assigned
+            if len(sample) < sample_size:
+                sample.extend(page[:sample_size - len(sample)])
+        project = await project_task
+    except Exception:
+        # A missing project explains the failure; if the project lookup fails
+        # too, report the original error rather than the lookup's
+        try:
+            missing = await project_task is None
+        except Exception:
+            missing = False
+        if missing:
+            return None, {}, []
+        raise
+    finally:
+        project_task.cancel()  # no-op once it has finished
+    
+    if project is None:
+        return None, {}, []
+    return project, {
+        "total_work_packages": total,
+        "work_packages_with_dates": with_dates,
+        "assigned_work_packages": assigned,
+        "unassigned_work_packages": total - assigned,
+        "status_breakdown": dict(status_counts),
+        "gantt_ready": with_dates > 0
+    }, sample
 
 
 @app.tool()
@@ -1267,139 +1472,116 @@ async def get_project_summary(project_id: int) -> str:
     """
     try:
         if project_id <= 0:
-            return json.dumps({
-                "success": False,
-                "error": "Project ID must be a positive integer"
-            })
+            return _ERR_PROJECT_ID_POS
         
-        # Get project details and work packages in parallel
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Get project details while summarizing its work packages
+        project, summary, _ = await _fetch_project_summary(project_id)
         
         if not project:
-            return json.dumps({
-                "success": False,
-                "error": f"Project with ID {project_id} not found"
-            })
-        
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        # Analyze work packages
-        total_wp = len(work_packages)
-        with_dates = sum(1 for wp in work_packages if wp.get("startDate") or wp.get("dueDate"))
-        assigned = sum(1 for wp in work_packages if wp.get("_links", {}).get("assignee"))
-        
-        status_counts = {}
-        for wp in work_packages:
-            status = wp.get("_links", {}).get("status", {}).get("title", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
+            return _error_response(f"Project with ID {project_id} not found")
         
-        return json.dumps({
+        return _dump({
             "success": True,
             "project": {
                 "id": project.get("id"),
                 "name": project.get("name"),
                 "description": project.get("description", {}).get("raw", ""),
                 "status": project.get("status"),
-                "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
+                "url": f"{_PROJECT_URL}{project.get('identifier', project.get('id'))}"
             },
-            "summary": {
-                "total_work_packages": total_wp,
-                "work_packages_with_dates": with_dates,
-                "assigned_work_packages": assigned,
-                "unassigned_work_packages": total_wp - assigned,
-                "status_breakdown": status_counts,
-                "gantt_ready": with_dates > 0
-            }
-        }, indent=2)
+            "summary": summary
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
     except Exception as e:
-        return json.dumps({
+        return _dump({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
-        }, indent=2)
-
-
-def _is_valid_date_format(date_string: str) -> bool:
-    """Validate date string is in YYYY-MM-DD format."""
-    try:
-        from datetime import datetime
-        datetime.strptime(date_string, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
+        })
 
 
 # Add resource handlers
 @app.resource("openproject://projects")
 async def projects_resource() -> str:
     """List all projects in OpenProject."""
+    # Cached next to get_projects so creating a project invalidates both
+    cache_key = ("get_projects", "resource")
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        projects = await openproject_client.get_projects()
-        
-        formatted_projects = []
-        for project in projects:
-            formatted_projects.append({
-                "id": project.get("id"),
-                "name": project.get("name"),
-                "description": project.get("description", {}).get("raw", ""),
-                "status": project.get("status"),
-                "identifier": project.get("identifier"),
-                "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
-            })
+        token = _response_cache.token()
+        projects = await _inflight.do(("get_projects", token), openproject_client.get_projects)
         
-        return json.dumps({
-            "projects": formatted_projects,
-            "total": len(formatted_projects),
-            "retrieved_at": "now"
-        }, indent=2)
+        return _response_cache.set(cache_key, _dump({
+            "projects": [_format_project(project) for project in projects],
+            "total": len(projects),
+            "retrieved_at": datetime.now(timezone.utc)
+        }), token)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
 
 
 @app.resource("openproject://project/{project_id}")
 async def project_resource(project_id: int) -> str:
     """Get details for a specific project."""
     try:
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Only the count is needed, so the work packages are not loaded
+        project, work_packages_count = await asyncio.gather(
+            openproject_client.get_project_by_id(project_id),
+            openproject_client.count_work_packages(project_id),
+            return_exceptions=True
+        )
+        if isinstance(project, BaseException):
+            raise project
         
         if not project:
-            return json.dumps({
+            return _dump({
                 "error": f"Project with ID {project_id} not found"
-            }, indent=2)
-        
-        # Get work packages for this project
-        work_packages = await openproject_client.get_work_packages(project_id)
+            })
+        if isinstance(work_packages_count, BaseException):
+            raise work_packages_count
         
-        return json.dumps({
-            "project": {
-                "id": project.get("id"),
-                "name": project.get("name"),
-                "description": project.get("description", {}).get("raw", ""),
-                "status": project.get("status"),
-                "identifier": project.get("identifier"),
-                "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
-            },
-            "work_packages_count": len(work_packages),
-            "retrieved_at": "now"
-        }, indent=2)
+        return _dump({
+            "project": _format_project(project),
+            "work_packages_count": work_packages_count,
+            "retrieved_at": datetime.now(timezone.utc)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
+
+
+def _format_resource_work_package(wp: Dict[str, Any], project_id: int) -> Dict[str, Any]:
+    """Format a work package for the work packages resource."""
+    links = wp.get("_links") or _EMPTY
+    wp_id = wp.get("id")
+    return {
+        "id": wp_id,
+        "subject": wp.get("subject"),
+        "description": (wp.get("description") or _EMPTY).get("raw", ""),
+        "project_id": project_id,
+        "start_date": wp.get("startDate"),
+        "due_date": wp.get("dueDate"),
+        "status": (links.get("status") or _EMPTY).get("title", "Unknown"),
+        "type": (links.get("type") or _EMPTY).get("title", "Unknown"),
+        "priority": (links.get("priority") or _EMPTY).get("title", "Unknown"),
+        "assignee": (links.get("assignee") or _EMPTY).get("title", "Unassigned"),
+        "url": f"{_WP_URL}{wp_id}"
+    }
 
 
 @app.resource("openproject://work-packages/{project_id}")
@@ -1408,34 +1590,20 @@ async def work_packages_resource(project_id: int) -> str:
     try:
         work_packages = await openproject_client.get_work_packages(project_id)
         
-        formatted_wps = []
-        for wp in work_packages:
-            formatted_wps.append({
-                "id": wp.get("id"),
-                "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", ""),
-                "project_id": project_id,
-                "start_date": wp.get("startDate"),
-                "due_date": wp.get("dueDate"),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
-            })
-        
-        return json.dumps({
-            "work_packages": formatted_wps,
+        return _dump({
+            "work_packages": [
+                _format_resource_work_package(wp, project_id) for wp in work_packages
+            ],
             "project_id": project_id,
-            "total": len(formatted_wps),
-            "retrieved_at": "now"
-        }, indent=2)
+            "total": len(work_packages),
+            "retrieved_at": datetime.now(timezone.utc)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
 
 
 @app.resource("openproject://work-package/{work_package_id}")
@@ -1444,30 +1612,30 @@ async def work_package_resource(work_package_id: int) -> str:
     try:
         work_package = await openproject_client.get_work_package_by_id(work_package_id)
         
-        return json.dumps({
+        return _dump({
             "work_package": {
                 "id": work_package.get("id"),
                 "subject": work_package.get("subject"),
                 "description": work_package.get("description", {}).get("raw", ""),
-                "project": work_package.get("_links", {}).get("project", {}).get("title", "Unknown"),
+                "project": _hal_title(work_package, "project"),
                 "start_date": work_package.get("startDate"),
                 "due_date": work_package.get("dueDate"),
-                "status": work_package.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": work_package.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": work_package.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": work_package.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
+                "status": _hal_title(work_package, "status"),
+                "type": _hal_title(work_package, "type"),
+                "priority": _hal_title(work_package, "priority"),
+                "assignee": _hal_title(work_package, "assignee", "Unassigned"),
                 "estimated_time": work_package.get("estimatedTime"),
                 "done_ratio": work_package.get("doneRatio", 0),
-                "url": f"{settings.openproject_url}/work_packages/{work_package.get('id')}"
+                "url": f"{_WP_URL}{work_package.get('id')}"
             },
-            "retrieved_at": "now"
-        }, indent=2)
+            "retrieved_at": datetime.now(timezone.utc)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
 
 
 @app.resource("openproject://work-package-relations/{work_package_id}")
@@ -1479,8 +1647,9 @@ async def work_package_relations_resource(work_package_id: int) -> str:
         formatted_relations = []
         for relation in relations:
             # Extract linked work packages info
-            from_wp = relation.get("_links", {}).get("from", {})
-            to_wp = relation.get("_links", {}).get("to", {})
+            links = relation.get("_links") or _EMPTY
+            from_wp = links.get("from") or _EMPTY
+            to_wp = links.get("to") or _EMPTY
             
             relation_data = {
                 "id": relation.get("id"),
@@ -1489,28 +1658,28 @@ async def work_package_relations_resource(work_package_id: int) -> str:
                 "description": relation.get("description", ""),
                 "lag": relation.get("lag", 0),
                 "from_work_package": {
-                    "id": from_wp.get("href", "").split("/")[-1] if from_wp.get("href") else None,
+                    "id": _href_id(from_href) if (from_href := from_wp.get("href")) else None,
                     "title": from_wp.get("title", "Unknown")
                 },
                 "to_work_package": {
-                    "id": to_wp.get("href", "").split("/")[-1] if to_wp.get("href") else None,
+                    "id": _href_id(to_href) if (to_href := to_wp.get("href")) else None,
                     "title": to_wp.get("title", "Unknown")
                 }
             }
             formatted_relations.append(relation_data)
         
-        return json.dumps({
+        return _dump({
             "work_package_id": work_package_id,
             "relations": formatted_relations,
             "total": len(formatted_relations),
-            "retrieved_at": "now"
-        }, indent=2)
+            "retrieved_at": datetime.now(timezone.utc)
+        })
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return _dump({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
-        }, indent=2)
+        })
 
 
 # Add prompt handlers
@@ -1525,9 +1694,8 @@ async def project_status_report(project_id: int) -> list:
         List of message objects for LLM consumption
     """
     try:
-        # Get project details and work packages
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Get project details and a summary of its work packages
+        project, summary, work_packages = await _fetch_project_summary(project_id, sample_size=10)
         
         if not project:
             return [
@@ -1537,42 +1705,23 @@ async def project_status_report(project_id: int) -> list:
                 }
             ]
         
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        # Analyze project status
-        total_wp = len(work_packages)
-        with_dates = sum(1 for wp in work_packages if wp.get("startDate") or wp.get("dueDate"))
-        assigned = sum(1 for wp in work_packages if wp.get("_links", {}).get("assignee"))
-        
-        status_counts = {}
-        for wp in work_packages:
-            status = wp.get("_links", {}).get("status", {}).get("title", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
         project_data = {
             "project": {
                 "name": project.get("name"),
                 "description": project.get("description", {}).get("raw", ""),
                 "status": project.get("status"),
-                "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
-            },
-            "summary": {
-                "total_work_packages": total_wp,
-                "work_packages_with_dates": with_dates,
-                "assigned_work_packages": assigned,
-                "unassigned_work_packages": total_wp - assigned,
-                "status_breakdown": status_counts,
-                "gantt_ready": with_dates > 0
+                "url": f"{_PROJECT_URL}{project.get('identifier', project.get('id'))}"
             },
+            "summary": summary,
             "work_packages": [
                 {
                     "subject": wp.get("subject"),
-                    "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                    "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
+                    "status": _hal_title(wp, "status"),
+                    "assignee": _hal_title(wp, "assignee", "Unassigned"),
                     "start_date": wp.get("startDate"),
                     "due_date": wp.get("dueDate")
                 }
-                for wp in work_packages[:10]  # Limit to first 10 for readability
+                for wp in work_packages  # Only the first 10, for readability
             ]
         }
         
@@ -1581,7 +1730,7 @@ async def project_status_report(project_id: int) -> list:
                 "role": "user",
                 "content": f"""Please analyze this project status data and provide a comprehensive report:
 
-{json.dumps(project_data, indent=2)}
+{_pretty_json(project_data)}
 
 Focus on:
 1. Overall project health and progress
@@ -1618,21 +1767,26 @@ async def work_package_summary(project_id: int, status_filter: str = "all") -> l
         
         # Filter by status if specified
         if status_filter != "all":
+            wanted_status = status_filter.lower()
             work_packages = [
                 wp for wp in work_packages 
-                if wp.get("_links", {}).get("status", {}).get("title", "").lower() == status_filter.lower()
+                if _hal_title(wp, "status", "").lower() == wanted_status
             ]
         
         wp_data = []
         for wp in work_packages:
+            links = wp.get("_links") or _EMPTY
+            description = (wp.get("description") or _EMPTY).get("raw") or ""
+            if len(description) > 200:
+                description = description[:200] + "..."
             wp_data.append({
                 "id": wp.get("id"),
                 "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", "")[:200] + "..." if len(wp.get("description", {}).get("raw", "")) > 200 else wp.get("description", {}).get("raw", ""),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
+                "description": description,
+                "status": (links.get("status") or _EMPTY).get("title", "Unknown"),
+                "type": (links.get("type") or _EMPTY).get("title", "Unknown"),
+                "priority": (links.get("priority") or _EMPTY).get("title", "Unknown"),
+                "assignee": (links.get("assignee") or _EMPTY).get("title", "Unassigned"),
                 "start_date": wp.get("startDate"),
                 "due_date": wp.get("dueDate"),
                 "done_ratio": wp.get("doneRatio", 0)
@@ -1643,7 +1797,7 @@ async def work_package_summary(project_id: int, status_filter: str = "all") -> l
                 "role": "user",
                 "content": f"""Please provide a summary of these work packages (filtered by status: {status_filter}):
 
-{json.dumps(wp_data, indent=2)}
+{_pretty_json(wp_data)}
 
 Please organize your summary by:
 1. High-priority items requiring attention
@@ -1710,6 +1864,32 @@ Please provide a structured breakdown that I can use to create the project in Op
     ]
 
 
+@lru_cache(maxsize=256)
+def _status_bucket(status_title: str) -> Optional[str]:
+    """Classify a status title as "in_progress", "completed" or neither.
+    
+    Instances only have a handful of statuses, so each title is matched
+    against the keywords once rather than for every work package.
+    """
+    status = status_title.lower()
+    if "progress" in status or "active" in status:
+        return "in_progress"
+    if "closed" in status or "done" in status:
+        return "completed"
+    return None
+
+
+def _new_workload_entry() -> Dict[str, Any]:
+    """Empty per-assignee counters for team_workload_analysis."""
+    return {
+        "total_tasks": 0,
+        "in_progress": 0,
+        "completed": 0,
+        "overdue": 0,
+        "projects": set()
+    }
+
+
 @app.prompt()
 async def team_workload_analysis(project_ids: list[int] = None) -> list:
     """Analyze team workload across projects.
@@ -1726,45 +1906,57 @@ async def team_workload_analysis(project_ids: list[int] = None) -> list:
             projects = await openproject_client.get_projects()
             project_ids = [p.get("id") for p in projects[:5]]  # Limit to first 5 for performance
         
-        workload_data = {}
+        workload_data = defaultdict(_new_workload_entry)
         total_work_packages = 0
         
-        for project_id in project_ids:
-            try:
-                work_packages = await openproject_client.get_work_packages(project_id)
-                total_work_packages += len(work_packages)
-                
-                for wp in work_packages:
-                    assignee = wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned")
-                    if assignee not in workload_data:
-                        workload_data[assignee] = {
-                            "total_tasks": 0,
-                            "in_progress": 0,
-                            "completed": 0,
-                            "overdue": 0,
-                            "projects": set()
-                        }
-                    
-                    workload_data[assignee]["total_tasks"] += 1
-                    workload_data[assignee]["projects"].add(project_id)
-                    
-                    status = wp.get("_links", {}).get("status", {}).get("title", "").lower()
-                    if "progress" in status or "active" in status:
-                        workload_data[assignee]["in_progress"] += 1
-                    elif "closed" in status or "done" in status:
-                        workload_data[assignee]["completed"] += 1
-                    
-                    # Check for overdue items (simplified check)
-                    due_date = wp.get("dueDate")
-                    if due_date and due_date < "2024-12-20":  # Simplified date check
-                        workload_data[assignee]["overdue"] += 1
-                        
-            except Exception:
-                continue  # Skip projects that can't be accessed
+        # Each counter is a grouped count query, so OpenProject does the
+        # counting and only one entry per assignee comes back
+        yesterday = (datetime.now(timezone.utc).date() - timedelta(days=1)).isoformat()
+        counters = {
+            "total_tasks": {},
+            "overdue": {"due_before": yesterday, "open_only": True}  # Due before today
+        }
+        status_ids = defaultdict(list)
+        for status in await openproject_client.get_work_package_statuses():
+            bucket = _status_bucket(status.get("name", ""))
+            if bucket:
+                status_ids[bucket].append(status.get("id"))
+        for bucket, ids in status_ids.items():
+            counters[bucket] = {"status_ids": ids}
+        
+        # Run all projects' count queries concurrently
+        queries = [(project_id, counter) for project_id in project_ids for counter in counters]
+        results = await asyncio.gather(
+            *(
+                openproject_client.group_work_packages(project_id, "assignee", **counters[counter])
+                for project_id, counter in queries
+            ),
+            return_exceptions=True
+        )
+        
+        # Skip projects that can't be accessed
+        failed = {
+            project_id
+            for (project_id, _), groups in zip(queries, results)
+            if isinstance(groups, Exception)
+        }
+        
+        for (project_id, counter), groups in zip(queries, results):
+            if project_id in failed:
+                continue
+            
+            for group in groups:
+                count = group.get("count", 0)
+                entry = workload_data[group.get("value") or "Unassigned"]
+                entry[counter] += count
+                if counter == "total_tasks":
+                    total_work_packages += count
+                    entry["projects"].add(project_id)
         
         # Convert sets to lists for JSON serialization
         for assignee_data in workload_data.values():
             assignee_data["projects"] = list(assignee_data["projects"])
+        workload_data = dict(workload_data)
         
         return [
             {
@@ -1774,7 +1966,7 @@ async def team_workload_analysis(project_ids: list[int] = None) -> list:
 Total work packages analyzed: {total_work_packages}
 
 Team workload breakdown:
-{json.dumps(workload_data, indent=2)}
+{_pretty_json(workload_data)}
 
 Please provide analysis on:
 1. **Workload Distribution:**
@@ -17,6 +17,9 @@ logger = get_logger(__name__)
 openproject_client = OpenProjectClient()
 resource_handler = ResourceHandler(openproject_client)
 
+# Compact responses unless MCP_PRETTY_JSON=1
+_JSON_INDENT = 2 if settings.mcp_pretty_json else None
+
 
 class MCPServer:
     """Simple MCP Server implementation compatible with Python 3.9."""
@@ -85,7 +88,7 @@ class MCPServer:
                     }
                 
                 log_tool_execution(logger, "health_check", {}, result)
-                return json.dumps(result, indent=2)
+                return json.dumps(result, indent=_JSON_INDENT)
                 
             except Exception as e:
                 error_result = {
@@ -94,7 +97,7 @@ class MCPServer:
                     "error": str(e)
                 }
                 log_error(logger, e, {"tool": "health_check"})
-                return json.dumps(error_result, indent=2)
+                return json.dumps(error_result, indent=_JSON_INDENT)
         
         @self.tool
         async def create_project(name: str, description: str = "") -> str:
@@ -123,19 +126,19 @@ class MCPServer:
                         "status": result.get("status"),
                         "url": f"{settings.openproject_url}/projects/{result.get('identifier', result.get('id'))}"
                     }
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def create_work_package(
@@ -188,19 +191,19 @@ class MCPServer:
                         "status": result.get("_links", {}).get("status", {}).get("title", "Unknown"),
                         "url": f"{settings.openproject_url}/work_packages/{result.get('id')}"
                     }
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def create_work_package_dependency(
@@ -262,19 +265,19 @@ class MCPServer:
                     "success": True,
                     "message": f"Relation created: Work package {from_work_package_id} {relation_type} work package {to_work_package_id}",
                     "relation": relation_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def get_work_package_relations(work_package_id: int) -> str:
@@ -315,19 +318,19 @@ class MCPServer:
                     "message": f"Found {len(relation_list)} relations for work package {work_package_id}",
                     "work_package_id": work_package_id,
                     "relations": relation_list
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def delete_work_package_relation(relation_id: int) -> str:
@@ -344,19 +347,19 @@ class MCPServer:
                 return json.dumps({
                     "success": True,
                     "message": f"Relation {relation_id} deleted successfully"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def get_projects() -> str:
@@ -379,19 +382,19 @@ class MCPServer:
                     "success": True,
                     "message": f"Found {len(project_list)} projects",
                     "projects": project_list
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
         
         @self.tool
         async def get_work_packages(project_id: int) -> str:
@@ -423,19 +426,19 @@ class MCPServer:
                     "success": True,
                     "message": f"Found {len(wp_list)} work packages in project {project_id}",
                     "work_packages": wp_list
-                }, indent=2)
+                }, indent=_JSON_INDENT)
                 
             except OpenProjectAPIError as e:
                 return json.dumps({
                     "success": False,
                     "error": f"OpenProject API error: {e.message}",
                     "details": e.response_data
-                }, indent=2)
+                }, indent=_JSON_INDENT)
             except Exception as e:
                 return json.dumps({
                     "success": False,
                     "error": f"Unexpected error: {str(e)}"
-                }, indent=2)
+                }, indent=_JSON_INDENT)
     
     def _register_resources(self):
         """Register resource handlers (simplified for Python 3.9)."""
@@ -1,7 +1,8 @@
 """Data models for OpenProject MCP Server."""
 from typing import Optional, List
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, validator
+from utils.validation import is_valid_date_format
 
 
 class Project(BaseModel):
@@ -55,7 +56,7 @@ class ProjectCreateRequest(BaseModel):
 
 class WorkPackageCreateRequest(BaseModel):
     """Request model for creating a work package."""
-    subject: str = Field(..., min_length=1, max_length=255)
+    subject: str = Field(..., max_length=255)
     description: Optional[str] = ""
     project_id: int = Field(..., gt=0)
     type_id: Optional[int] = 1
@@ -67,39 +68,45 @@ class WorkPackageCreateRequest(BaseModel):
     due_date: Optional[str] = None
     estimated_hours: Optional[float] = None
 
-    @validator('start_date', 'due_date')
+    @field_validator('subject', mode='before')
+    @classmethod
+    def validate_subject(cls, v):
+        """Strip the subject and require it to be non-empty."""
+        if isinstance(v, str):
+            v = v.strip()
+        if not v:
+            raise ValueError("Work package subject is required and cannot be empty")
+        return v
+
+    @field_validator('start_date', 'due_date')
+    @classmethod
     def validate_date_format(cls, v):
         """Validate date format is YYYY-MM-DD."""
-        if v is not None:
-            try:
-                datetime.strptime(v, "%Y-%m-%d")
-            except ValueError:
-                raise ValueError("Date must be in YYYY-MM-DD format")
+        if v is not None and not is_valid_date_format(v):
+            raise ValueError("Date must be in YYYY-MM-DD format")
         return v
     
-    @validator('due_date')
-    def validate_due_after_start(cls, v, values):
+    @field_validator('due_date')
+    @classmethod
+    def validate_due_after_start(cls, v, info: ValidationInfo):
         """Validate due date is after start date."""
-        if v and values.get('start_date'):
-            try:
-                start = datetime.strptime(values['start_date'], "%Y-%m-%d")
-                due = datetime.strptime(v, "%Y-%m-%d")
-                if due < start:
-                    raise ValueError("Due date must be after start date")
-            except ValueError as e:
-                if "Date must be in YYYY-MM-DD format" not in str(e):
-                    raise ValueError("Due date must be after start date")
+        # Both dates are validated YYYY-MM-DD strings here, which sort chronologically
+        start_date = info.data.get('start_date')
+        if v and start_date and v < start_date:
+            raise ValueError("Due date must be after start date")
         return v
 
-    @validator('estimated_hours')
+    @field_validator('estimated_hours')
+    @classmethod
     def validate_estimated_hours(cls, v):
         """Validate estimated hours is positive."""
         if v is not None and v <= 0:
             raise ValueError("Estimated hours must be positive")
         return v
 
-    @validator('parent_id')
-    def validate_parent_id(cls, v, values):
+    @field_validator('parent_id')
+    @classmethod
+    def validate_parent_id(cls, v):
         """Validate parent ID is not the same as work package ID (can't validate at creation time)."""
         if v is not None and v <= 0:
             raise ValueError("Parent ID must be a positive integer")
@@ -1,15 +1,97 @@
 """OpenProject API client for MCP server."""
-import json
 import base64
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import asyncio
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import AsyncIterator, Dict, List, Any, Optional, Sequence, Tuple, Union
 import httpx
+import orjson
+
+try:
+    import h2  # noqa: F401  # enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 from config import settings
 from models import Project, WorkPackage, ProjectCreateRequest, WorkPackageCreateRequest
+from utils.cache import SingleFlight
 from utils.logging import get_logger, log_api_request, log_api_response, log_error
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent page requests in get_paginated_results()
+PAGE_FETCH_CONCURRENCY = 8
+# Upper bound on concurrent create requests in the bulk_create_* methods
+BULK_CREATE_CONCURRENCY = 8
+# Upper bound on entries in the metadata/user cache; oldest entries go first
+CACHE_MAXSIZE = 512
+# Upper bound on remembered work package lockVersions; oldest entries go first
+LOCK_VERSION_MAXSIZE = 1024
+# Attempts per request and total seconds spent waiting between them when
+# OpenProject is rate limiting (429), unavailable (503) or unreachable
+RETRY_MAX_ATTEMPTS = 5
+RETRY_MAX_WAIT = 30.0
+RETRY_BACKOFF_BASE = 0.5
+
+_RETRY_STATUSES = frozenset({429, 503})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# Transport errors worth retrying on any method: the request never left the client
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+# Transport errors worth retrying on idempotent methods only
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+_SORT_FIELDS = frozenset({
+    "id", "subject", "updatedAt", "createdAt", "dueDate", "startDate", "status", "priority", "type"
+})
+
+
+# Near-static collections that are revalidated with If-None-Match once the
+# metadata cache expires, instead of being downloaded and parsed again
+_REVALIDATED_PATHS = frozenset({"/types", "/statuses", "/priorities"})
+
+
+@lru_cache(maxsize=4)
+def _auth_header(api_key: str) -> str:
+    """Build the Basic Authorization header value for an API key."""
+    return f"Basic {base64.b64encode(f'apikey:{api_key}'.encode()).decode()}"
+
+
+def _select_param(fields: Sequence[str]) -> str:
+    """Build a select parameter that only returns the given element fields.
+    
+    Fields are attribute or link names (e.g. subject, dueDate, status). The
+    collection total and page size are always kept, since pagination relies
+    on them.
+    """
+    return ",".join(["total", "pageSize", *(f"elements/{field}" for field in fields)])
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds to wait according to a Retry-After header (delta-seconds or HTTP-date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@lru_cache(maxsize=64)
+def _sort_by_param(field: str, direction: str) -> str:
+    """Encode an OpenProject sortBy parameter, memoized per field and direction."""
+    return orjson.dumps([[field, direction]]).decode()
+
 
 class OpenProjectAPIError(Exception):
     """Exception raised for OpenProject API errors."""
@@ -17,41 +99,42 @@ class OpenProjectAPIError(Exception):
         self.message = message
         self.status_code = status_code
         self.response_data = response_data or {}
+        self.openproject_error_code = None
         
-        # Enhanced error handling for OpenProject-specific formats
-        if response_data and "_embedded" in response_data:
-            # Handle HAL+JSON error structures
-            errors = response_data.get("_embedded", {}).get("errors", [])
-            if errors:
-                self.detailed_errors = errors
-                # Extract more specific error messages from HAL structure
-                error_messages = []
-                for error in errors:
-                    if isinstance(error, dict):
-                        error_msg = error.get("message", "")
-                        if error_msg:
-                            error_messages.append(error_msg)
-                if error_messages:
-                    self.message = "; ".join(error_messages)
+        # Transport failures and empty error bodies have nothing to inspect
+        if not response_data:
+            super().__init__(message)
+            return
         
         # Add OpenProject-specific error codes
-        self.openproject_error_code = response_data.get("error_code") if response_data else None
+        self.openproject_error_code = response_data.get("error_code")
+        
+        # Enhanced error handling for OpenProject-specific formats
+        embedded = response_data.get("_embedded")
+        errors = embedded.get("errors") if isinstance(embedded, dict) else None
+        if errors:
+            # Handle HAL+JSON error structures
+            self.detailed_errors = errors
+            # Extract more specific error messages from HAL structure
+            error_messages = [
+                error["message"] for error in errors
+                if isinstance(error, dict) and error.get("message")
+            ]
+            if error_messages:
+                self.message = "; ".join(error_messages)
         
         # Extract validation errors if present
-        if response_data and "errors" in response_data:
-            validation_errors = response_data.get("errors", {})
-            if isinstance(validation_errors, dict):
-                self.validation_errors = validation_errors
-                # Create more descriptive error message from validation errors
-                error_details = []
-                for field, field_errors in validation_errors.items():
-                    if isinstance(field_errors, list):
-                        for error in field_errors:
-                            error_details.append(f"{field}: {error}")
-                    else:
-                        error_details.append(f"{field}: {field_errors}")
-                if error_details:
-                    self.message = f"{self.message}. Validation errors: {'; '.join(error_details)}"
+        validation_errors = response_data.get("errors")
+        if isinstance(validation_errors, dict):
+            self.validation_errors = validation_errors
+            # Create more descriptive error message from validation errors
+            error_details = [
+                f"{field}: {error}"
+                for field, field_errors in validation_errors.items()
+                for error in (field_errors if isinstance(field_errors, list) else [field_errors])
+            ]
+            if error_details:
+                self.message = f"{self.message}. Validation errors: {'; '.join(error_details)}"
         
         super().__init__(self.message)
 
@@ -66,40 +149,83 @@ class OpenProjectClient:
         
         # Initialize cache
         self._cache = {}
-        self._cache_timeout = timedelta(minutes=5)
+        # Entries are (data, expiry deadline on the monotonic clock)
+        self._cache_ttl = settings.openproject_metadata_ttl
+        # Concurrent misses for the same cache key share one fetch
+        self._inflight = SingleFlight()
+        # ETag and parsed body per revalidated path
+        self._etags: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
+        # Last seen lockVersion per work package, for optimistic locking on updates
+        self._lock_versions: Dict[int, int] = {}
         
-        # Encode API key for Basic authentication
-        auth_string = base64.b64encode(f'apikey:{self.api_key}'.encode()).decode()
+        self.client = self._create_http_client()
+    
+    def _create_http_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client shared by all requests of this instance.
         
-        # HTTP client configuration
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
+        Requests reuse keep-alive connections instead of reconnecting every call.
+        With the h2 package installed, HTTPS connections negotiate HTTP/2 so
+        concurrent requests are multiplexed over a single connection.
+        """
+        return httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0
+            ),
             headers={
-                "Authorization": f"Basic {auth_string}",
+                "Authorization": _auth_header(self.api_key),
                 "Content-Type": "application/json",
                 "Accept": "application/json",
                 "Host": settings.openproject_host_header or "localhost"
             }
         )
     
-    async def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request to OpenProject API."""
+    async def _make_request(self, method: str, url: str, retry: bool = True, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request to OpenProject API.
+        
+        Pass ``retry=False`` to make a single attempt, e.g. for health probes
+        that must fail fast instead of waiting out an upstream outage.
+        """
         full_url = f"{self.api_base}{url}"
         
         # Log the request
         log_api_request(logger, method, full_url)
         
+        # Reopen the pool if close() ran, e.g. when the server lifespan restarts
+        if self.client.is_closed:
+            self.client = self._create_http_client()
+        
+        # Encode request bodies with orjson; the client already sends the
+        # application/json Content-Type header
+        payload = kwargs.pop("json", None)
+        if payload is not None:
+            kwargs["content"] = orjson.dumps(payload)
+        
+        revalidate = method == "GET" and url in _REVALIDATED_PATHS
+        known = self._etags.get(url) if revalidate else None
+        if known is not None:
+            kwargs["headers"] = {**kwargs.get("headers", {}), "If-None-Match": known[0]}
+        
         try:
-            response = await self.client.request(method, full_url, **kwargs)
+            response = await self._send_with_retry(
+                method, full_url, kwargs, RETRY_MAX_ATTEMPTS if retry else 1
+            )
             
             # Log the response
             log_api_response(logger, method, full_url, response.status_code)
             
+            if response.status_code == 304 and known is not None:
+                return known[1]
+            
             # Check for HTTP errors
             if response.status_code >= 400:
                 error_data = {}
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(response.content)
                 except:
                     pass
                 
@@ -111,20 +237,73 @@ class OpenProjectClient:
                 log_error(logger, error, {"url": full_url, "method": method, "status_code": response.status_code})
                 raise error
             
-            # Parse JSON response
-            if response.content:
-                return response.json()
-            return {}
+            # Parse JSON response (orjson is much faster on large HAL collections)
+            content = response.content
+            if not content:
+                return {}
+            data = orjson.loads(content)
+            if revalidate and "ETag" in response.headers:
+                self._etags[url] = (response.headers["ETag"], data)
+            return data
             
         except httpx.RequestError as e:
             error = OpenProjectAPIError(f"Request failed: {str(e)}")
             log_error(logger, error, {"url": full_url, "method": method})
             raise error
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             error = OpenProjectAPIError(f"Invalid JSON response: {str(e)}")
             log_error(logger, error, {"url": full_url, "method": method})
             raise error
     
+    async def _send_with_retry(
+        self,
+        method: str,
+        full_url: str,
+        kwargs: Dict[str, Any],
+        max_attempts: int = RETRY_MAX_ATTEMPTS
+    ) -> httpx.Response:
+        """Send a request, retrying 429/503 responses and transient transport errors.
+        
+        The wait honors Retry-After when OpenProject sends it and otherwise
+        backs off exponentially with jitter, so concurrent callers do not
+        retry in lockstep. At most ``max_attempts`` attempts are made and
+        RETRY_MAX_WAIT seconds spent waiting; after that the last response is
+        returned (or the last error raised) for _make_request to report.
+        Other 4xx responses such as validation errors are never retried.
+        Non-idempotent requests are only retried on errors that guarantee the
+        request was not sent, or on 429/503.
+        """
+        retryable_errors = _TRANSIENT_ERRORS if method in _IDEMPOTENT_METHODS else _UNSENT_ERRORS
+        deadline = time.monotonic() + RETRY_MAX_WAIT
+        for attempt in range(1, max_attempts + 1):
+            response = error = None
+            try:
+                response = await self.client.request(method, full_url, **kwargs)
+            except retryable_errors as e:
+                if attempt == max_attempts:
+                    raise
+                error = e
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code not in _RETRY_STATUSES or attempt == max_attempts:
+                    return response
+                reason = f"{response.status_code} {response.reason_phrase}"
+            
+            remaining = deadline - time.monotonic()
+            delay = _retry_after(response) if response is not None else None
+            if delay is None:
+                backoff = RETRY_BACKOFF_BASE * 2 ** (attempt - 1)
+                delay = min(backoff + random.uniform(0, RETRY_BACKOFF_BASE), remaining)
+            if remaining <= 0 or delay > remaining:
+                # Retrying before the server asked us to would only be rejected again
+                break
+            logger.warning(f"Retrying {method} {full_url} in {delay:.2f}s after {reason}")
+            await asyncio.sleep(delay)
+        
+        if error is not None:
+            raise error
+        return response
+    
     async def get_projects(self, use_pagination: bool = False) -> List[Dict[str, Any]]:
         """Get list of projects."""
         if use_pagination:
@@ -132,6 +311,15 @@ class OpenProjectClient:
         response = await self._make_request("GET", "/projects")
         return response.get("_embedded", {}).get("elements", [])
     
+    async def get_project_by_id(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Get a specific project by ID, or None if it does not exist."""
+        try:
+            return await self._make_request("GET", f"/projects/{project_id}")
+        except OpenProjectAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+    
     async def create_project(self, project_data: ProjectCreateRequest) -> Dict[str, Any]:
         """Create a new project."""
         payload = {
@@ -147,14 +335,92 @@ class OpenProjectClient:
         
         return await self._make_request("POST", "/projects", json=payload)
     
-    async def get_work_packages(self, project_id: int, use_pagination: bool = False) -> List[Dict[str, Any]]:
-        """Get work packages for a project."""
+    async def get_work_packages(
+        self,
+        project_id: int,
+        use_pagination: bool = False,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get work packages for a project.
+        
+        Pass ``fields`` to download only those attributes and links of each
+        work package instead of the full HAL representation.
+        """
         url = f"/projects/{project_id}/work_packages"
+        params = {"select": _select_param(fields)} if fields else None
         if use_pagination:
-            return await self.get_paginated_results(url)
-        response = await self._make_request("GET", url)
+            return await self.get_paginated_results(url, params)
+        if params:
+            response = await self._make_request("GET", url, params=params)
+        else:
+            response = await self._make_request("GET", url)
         return response.get("_embedded", {}).get("elements", [])
     
+    async def count_work_packages(self, project_id: int) -> int:
+        """Get the number of work packages in a project without loading them."""
+        response = await self._make_request(
+            "GET", f"/projects/{project_id}/work_packages", params={"pageSize": 1}
+        )
+        return response.get("total", 0)
+    
+    async def group_work_packages(
+        self,
+        project_id: int,
+        group_by: str = "assignee",
+        status_ids: Optional[List[int]] = None,
+        due_before: Optional[str] = None,
+        open_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Count a project's work packages per group without loading them.
+        
+        Uses OpenProject's groupBy query, which reports a ``value`` and
+        ``count`` for every group. All work packages are counted, including
+        closed ones, unless narrowed down by the filters.
+        
+        Args:
+            project_id: Project to count work packages in
+            group_by: Attribute to group by (assignee, status, type, etc)
+            status_ids: Only count work packages with these status IDs
+            due_before: Only count work packages due on or before this date (YYYY-MM-DD)
+            open_only: Only count work packages with an open status
+        
+        Returns:
+            List of group entries
+        """
+        filter_list = []
+        if open_only:
+            filter_list.append(self._build_filter("status", "o", []))
+        if status_ids:
+            filter_list.append(self._build_filter("status", "=", status_ids))
+        if due_before:
+            filter_list.append(self._build_filter("dueDate", "<>d", ["1900-01-01", due_before]))
+        
+        params = {
+            "pageSize": 1,
+            "groupBy": group_by,
+            # Sent even when empty, to replace the default "open only" filter
+            "filters": orjson.dumps(filter_list).decode()
+        }
+        response = await self._make_request(
+            "GET", f"/projects/{project_id}/work_packages", params=params
+        )
+        return response.get("groups", [])
+    
+    def iter_work_packages(
+        self,
+        project_id: int,
+        page_size: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Iterate over all work packages of a project one page at a time.
+        
+        Pass ``fields`` to download only those attributes and links.
+        """
+        params = {"select": _select_param(fields)} if fields else None
+        return self.iter_paginated_results(
+            f"/projects/{project_id}/work_packages", params, page_size=page_size
+        )
+    
     async def create_work_package(self, work_package_data: WorkPackageCreateRequest) -> Dict[str, Any]:
         """Create a new work package."""
         payload = {
@@ -200,10 +466,101 @@ class OpenProjectClient:
         
         return await self._make_request("POST", "/work_packages", json=payload)
     
-    async def update_work_package(self, work_package_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
-        """Update an existing work package."""
+    async def bulk_create_work_packages(
+        self,
+        work_packages: Sequence[WorkPackageCreateRequest]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create several work packages concurrently.
+        
+        OpenProject has no bulk work package endpoint, so this issues one
+        request per work package, at most BULK_CREATE_CONCURRENCY at a time.
+        A failed item does not stop the others.
+        
+        Args:
+            work_packages: Work packages to create
+        
+        Returns:
+            Created work package or the raised exception, in input order
+        """
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+        
+        async def create(work_package: WorkPackageCreateRequest) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_work_package(work_package)
+        
+        return await asyncio.gather(
+            *(create(work_package) for work_package in work_packages),
+            return_exceptions=True
+        )
+    
+    async def update_work_package(
+        self,
+        work_package_id: int,
+        updates: Dict[str, Any],
+        retries: int = 2
+    ) -> Dict[str, Any]:
+        """Update an existing work package.
+        
+        OpenProject requires the current lockVersion on every update. If
+        ``updates`` does not carry one, the last known lockVersion is used
+        (fetching the work package only when none is known yet), and on a
+        409 Conflict the lockVersion is refreshed and the update retried up to
+        ``retries`` times. An explicit lockVersion is sent as-is, without retry.
+        """
         url = f"/work_packages/{work_package_id}"
-        return await self._make_request("PATCH", url, json=updates)
+        if "lockVersion" in updates:
+            result = await self._make_request("PATCH", url, json=updates)
+            self._remember_lock_version(result)
+            return result
+        
+        lock_version = self._lock_versions.get(work_package_id)
+        for attempt in range(retries + 1):
+            if lock_version is None:
+                lock_version = await self._fetch_lock_version(work_package_id)
+            try:
+                result = await self._make_request(
+                    "PATCH", url, json={**updates, "lockVersion": lock_version}
+                )
+            except OpenProjectAPIError as e:
+                if e.status_code == 404:
+                    self._lock_versions.pop(work_package_id, None)
+                if e.status_code != 409 or attempt == retries:
+                    raise
+                # Stale lockVersion: someone else updated the work package
+                self._lock_versions.pop(work_package_id, None)
+                lock_version = None
+                continue
+            self._remember_lock_version(result)
+            return result
+    
+    async def _fetch_lock_version(self, work_package_id: int) -> int:
+        """Fetch the current lockVersion of a work package."""
+        await self.get_work_package_by_id(work_package_id)
+        lock_version = self._lock_versions.get(work_package_id)
+        if lock_version is None:
+            raise OpenProjectAPIError(
+                "Unable to retrieve lock version for work package. It may not exist."
+            )
+        return lock_version
+    
+    async def prefetch_lock_version(self, work_package_id: int) -> None:
+        """Load the lockVersion for a later update_work_package() call if not yet known."""
+        if work_package_id not in self._lock_versions:
+            await self._fetch_lock_version(work_package_id)
+    
+    def _remember_lock_version(self, work_package: Dict[str, Any]) -> None:
+        """Record the lockVersion from a work package response.
+        
+        Evicts the least recently recorded work package when the map is full.
+        """
+        wp_id = work_package.get("id")
+        lock_version = work_package.get("lockVersion")
+        if wp_id is None or lock_version is None:
+            return
+        self._lock_versions.pop(wp_id, None)
+        if len(self._lock_versions) >= LOCK_VERSION_MAXSIZE:
+            del self._lock_versions[next(iter(self._lock_versions))]
+        self._lock_versions[wp_id] = lock_version
     
     async def add_work_package_comment(self, work_package_id: int, comment: str) -> Dict[str, Any]:
         """Add a comment to a work package via the activities endpoint.
@@ -249,7 +606,8 @@ class OpenProjectClient:
         sort_by: str = "id",
         sort_order: str = "desc",
         page_size: int = 100,
-        offset: int = 0
+        offset: int = 0,
+        fields: Optional[Sequence[str]] = None
     ) -> Dict[str, Any]:
         """Search work packages with advanced filtering.
         
@@ -272,21 +630,64 @@ class OpenProjectClient:
             sort_order: Sort direction (asc or desc)
             page_size: Number of results per page (max 100)
             offset: Offset for pagination
+            fields: Only return these work package attributes and links
             
         Returns:
             Dict with work packages list and metadata
         """
+        params = self._build_search_params(
+            project_id=project_id,
+            status_ids=status_ids,
+            assignee_id=assignee_id,
+            type_ids=type_ids,
+            priority_ids=priority_ids,
+            created_after=created_after,
+            created_before=created_before,
+            due_after=due_after,
+            due_before=due_before,
+            subject_contains=subject_contains,
+            custom_filters=custom_filters,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            page_size=page_size,
+            fields=fields
+        )
+        params["offset"] = offset
+        return await self._make_request("GET", "/work_packages", params=params)
+    
+    def _build_search_params(
+        self,
+        project_id: Optional[int] = None,
+        status_ids: Optional[List[int]] = None,
+        assignee_id: Optional[int] = None,
+        type_ids: Optional[List[int]] = None,
+        priority_ids: Optional[List[int]] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        due_after: Optional[str] = None,
+        due_before: Optional[str] = None,
+        subject_contains: Optional[str] = None,
+        custom_filters: Optional[List[Dict]] = None,
+        sort_by: str = "id",
+        sort_order: str = "desc",
+        page_size: int = 100,
+        fields: Optional[Sequence[str]] = None
+    ) -> Dict[str, Any]:
+        """Build the query parameters for a work package search, except the offset.
+        
+        Takes the same filter and sorting arguments as search_work_packages().
+        """
         # Build query parameters
         params = {
-            "pageSize": min(page_size, 100),
-            "offset": offset
+            "pageSize": min(page_size, 100)
         }
+        if fields:
+            params["select"] = _select_param(fields)
         
         # Add sorting with validation
-        allowed_sort_fields = ["id", "subject", "updatedAt", "createdAt", "dueDate", "startDate", "status", "priority", "type"]
-        validated_sort_by = sort_by if sort_by in allowed_sort_fields else "id"
+        validated_sort_by = sort_by if sort_by in _SORT_FIELDS else "id"
         sort_direction = "asc" if sort_order == "asc" else "desc"
-        params["sortBy"] = json.dumps([[validated_sort_by, sort_direction]])
+        params["sortBy"] = _sort_by_param(validated_sort_by, sort_direction)
         
         # Build filters array
         filter_list = []
@@ -332,10 +733,9 @@ class OpenProjectClient:
         
         # Encode filters as JSON if any exist
         if filter_list:
-            params["filters"] = json.dumps(filter_list)
+            params["filters"] = orjson.dumps(filter_list).decode()
         
-        response = await self._make_request("GET", "/work_packages", params=params)
-        return response
+        return params
     
     def _build_filter(self, field: str, operator: str, values: List[Any]) -> Dict:
         """Helper to build OpenProject filter format.
@@ -355,6 +755,14 @@ class OpenProjectClient:
             }
         }
     
+    def email_filter_params(self, *emails: str) -> Dict[str, str]:
+        """Build get_users() filters matching any of the given email addresses.
+        
+        The filter is JSON-encoded, so quotes or backslashes in an address
+        cannot break the query.
+        """
+        return {"filters": orjson.dumps([self._build_filter("email", "=", list(emails))]).decode()}
+    
     async def create_work_package_relation(
         self, 
         from_wp_id: int, 
@@ -393,6 +801,32 @@ class OpenProjectClient:
         
         return await self._make_request("POST", url, json=payload)
     
+    async def bulk_create_relations(
+        self,
+        relations: Sequence[Tuple[int, int, str, str, int]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """Create several work package relations concurrently.
+        
+        OpenProject has no bulk relation endpoint, so this issues one request
+        per relation over the shared connection pool.
+        
+        Args:
+            relations: (from_wp_id, to_wp_id, relation_type, description, lag) tuples
+        
+        Returns:
+            Created relation or the raised exception, in input order
+        """
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+        
+        async def create(relation: Tuple[int, int, str, str, int]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_work_package_relation(*relation)
+        
+        return await asyncio.gather(
+            *(create(relation) for relation in relations),
+            return_exceptions=True
+        )
+    
     async def get_work_package_relations(self, work_package_id: int) -> List[Dict[str, Any]]:
         """Get all relations for a specific work package."""
         url = f"/work_packages/{work_package_id}/relations"
@@ -407,12 +841,18 @@ class OpenProjectClient:
     async def get_work_package_by_id(self, work_package_id: int) -> Dict[str, Any]:
         """Get a specific work package by ID."""
         url = f"/work_packages/{work_package_id}"
-        return await self._make_request("GET", url)
+        work_package = await self._make_request("GET", url)
+        self._remember_lock_version(work_package)
+        return work_package
     
     async def test_connection(self) -> Dict[str, Any]:
-        """Test connection to OpenProject API."""
+        """Test connection to OpenProject API.
+        
+        Makes a single attempt without retries, so health checks report an
+        outage promptly.
+        """
         try:
-            response = await self._make_request("GET", "/")
+            response = await self._make_request("GET", "/", retry=False)
             return {
                 "success": True,
                 "message": "Connection successful",
@@ -427,11 +867,8 @@ class OpenProjectClient:
     
     async def get_users(self, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Get list of users with optional filtering."""
-        url = "/users"
-        if filters:
-            params = "&".join([f"{k}={v}" for k, v in filters.items()])
-            url += f"?{params}"
-        response = await self._make_request("GET", url)
+        # Let httpx build and URL-encode the query string
+        response = await self._make_request("GET", "/users", params=filters or None)
         return response.get("_embedded", {}).get("elements", [])
 
     async def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
@@ -439,11 +876,65 @@ class OpenProjectClient:
         return await self._make_request("GET", f"/users/{user_id}")
 
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email address."""
+        """Get user by email address.
+        
+        Found users are cached like other metadata; misses are not, so a user
+        created afterwards is picked up on the next lookup.
+        """
+        cache_key = self._user_email_cache_key(email)
+        user = await self.get_cached_or_fetch(cache_key, lambda: self._fetch_user_by_email(email))
+        if user is None:
+            self._clear_cache_key(cache_key)
+        return user
+    
+    async def get_users_by_emails(self, emails: Sequence[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Look up several users by email address with a single request.
+        
+        Cached users are served from the cache; the rest are fetched with one
+        email filter and cached like get_user_by_email() results.
+        
+        Returns:
+            Mapping of lowercased email address to user, or None if not found
+        """
+        now = time.monotonic()
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        for email in dict.fromkeys(email.lower() for email in emails):
+            cached = self._cache.get(self._user_email_cache_key(email))
+            if cached is not None and now < cached[1]:
+                found[email] = cached[0]
+            else:
+                found[email] = None
+                missing.append(email)
+        if not missing:
+            return found
+        
+        users = await self.get_users(self.email_filter_params(*missing))
+        unmatched = set(missing)
+        for user in users:
+            email = (user.get("email") or "").lower()
+            if email in unmatched:
+                found[email] = user
+                unmatched.discard(email)
+                self._set_cached(self._user_email_cache_key(email), user)
+        
+        if unmatched and any("email" not in user for user in users):
+            # The email attribute is only visible to admins; without it the
+            # results cannot be matched up, so resolve the rest one by one
+            remaining = list(unmatched)
+            results = await asyncio.gather(*(self.get_user_by_email(email) for email in remaining))
+            found.update(zip(remaining, results))
+        return found
+    
+    @staticmethod
+    def _user_email_cache_key(email: str) -> str:
+        """Cache key for a user looked up by email address."""
+        return f"user_by_email:{email.lower()}"
+    
+    async def _fetch_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
+        """Internal method to look up a user by email from API."""
         try:
-            # OpenProject API filter format for email search
-            filters = f'[{{"email": {{"operator": "=", "values": ["{email}"]}}}}]'
-            users = await self.get_users({"filters": filters})
+            users = await self.get_users(self.email_filter_params(email))
             return users[0] if users else None
         except (OpenProjectAPIError, IndexError):
             return None
@@ -498,18 +989,26 @@ class OpenProjectClient:
 
     async def get_cached_or_fetch(self, cache_key: str, fetch_func):
         """Get cached result or fetch fresh data."""
-        now = datetime.now()
+        cached = self._cache.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1]:
+            logger.debug(f"Cache hit for key: {cache_key}")
+            return cached[0]
         
-        if cache_key in self._cache:
-            cached_data, timestamp = self._cache[cache_key]
-            if now - timestamp < self._cache_timeout:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return cached_data
+        async def fetch_and_store():
+            logger.debug(f"Cache miss for key: {cache_key}, fetching fresh data")
+            fresh_data = await fetch_func()
+            self._set_cached(cache_key, fresh_data)
+            return fresh_data
         
-        logger.debug(f"Cache miss for key: {cache_key}, fetching fresh data")
-        fresh_data = await fetch_func()
-        self._cache[cache_key] = (fresh_data, now)
-        return fresh_data
+        return await self._inflight.do(cache_key, fetch_and_store)
+
+    def _set_cached(self, cache_key: str, data: Any):
+        """Store a cache entry, evicting the oldest one when the cache is full."""
+        self._cache.pop(cache_key, None)
+        if len(self._cache) >= CACHE_MAXSIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._cache[next(iter(self._cache))]
+        self._cache[cache_key] = (data, time.monotonic() + self._cache_ttl)
 
     def _clear_cache_key(self, cache_key: str):
         """Clear specific cache key."""
@@ -523,32 +1022,82 @@ class OpenProjectClient:
         logger.debug("Cleared all cache data")
 
     async def get_paginated_results(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
-        """Handle paginated responses from OpenProject API."""
-        all_results = []
-        page_size = 100  # OpenProject default
-        offset = 0
-        
-        while True:
-            paginated_params = {"pageSize": page_size, "offset": offset}
-            if params:
-                paginated_params.update(params)
+        """Handle paginated responses from OpenProject API.
+        
+        The first page reports the collection total; the remaining pages are
+        then requested concurrently, at most PAGE_FETCH_CONCURRENCY at a time.
+        """
+        response = await self._fetch_page(endpoint, params, 1, 100)
+        all_results = list(response.get("_embedded", {}).get("elements", []))
+        if not all_results:
+            return all_results
+        
+        # The server may cap pageSize below what was asked for; page offsets
+        # are page numbers, so the rest must be requested at the size it used
+        page_size = response.get("pageSize") or response.get("count") or len(all_results)
+        page_count = -(-response.get("total", 0) // page_size)
+        semaphore = asyncio.Semaphore(PAGE_FETCH_CONCURRENCY)
+        
+        async def fetch(page: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._fetch_page(endpoint, params, page, page_size)
+        
+        responses = await asyncio.gather(*(fetch(page) for page in range(2, page_count + 1)))
+        for response in responses:
+            all_results.extend(response.get("_embedded", {}).get("elements", []))
+        return all_results
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        page: int,
+        page_size: int
+    ) -> Dict[str, Any]:
+        """Request one page of a paginated collection."""
+        # OpenProject's offset is the 1-based page number, not an element index
+        paginated_params = {"pageSize": page_size, "offset": page}
+        if params:
+            paginated_params.update(params)
+        return await self._make_request("GET", endpoint, params=paginated_params)
+
+    async def iter_paginated_results(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        page_size: int = 100
+    ) -> AsyncIterator[List[Dict]]:
+        """Yield the elements of a paginated collection one page at a time.
+        
+        The next page is requested before the current one is yielded, so the
+        caller can process a page while the following one is in flight.
+        """
+        def fetch(page: int) -> "asyncio.Future[Dict[str, Any]]":
+            return asyncio.ensure_future(self._fetch_page(endpoint, params, page, page_size))
+        
+        page = 1
+        pending = fetch(page)
+        try:
+            while pending is not None:
+                response = await pending
+                pending = None
+                elements = response.get("_embedded", {}).get("elements", [])
+                if not elements:
+                    return
                 
-            response = await self._make_request("GET", endpoint, params=paginated_params)
-            elements = response.get("_embedded", {}).get("elements", [])
-            
-            if not elements:
-                break
+                # Keep paging at the size the server actually used; a full
+                # first page tells it even if pageSize was left out
+                page_size = response.get("pageSize") or (len(elements) if page == 1 else page_size)
                 
-            all_results.extend(elements)
-            
-            # Check if we have more pages
-            total = response.get("total", 0)
-            if offset + page_size >= total:
-                break
+                # Check if we have more pages
+                if page * page_size < response.get("total", 0):
+                    page += 1
+                    pending = fetch(page)
                 
-            offset += page_size
-        
-        return all_results
+                yield elements
+        finally:
+            if pending is not None:
+                pending.cancel()
 
     async def close(self):
         """Close the HTTP client."""
@@ -0,0 +1,117 @@
+"""In-memory caching utilities for OpenProject MCP Server."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """TTL cache for serialized tool responses with a stale-on-error window.
+
+    Entries are fresh for ``ttl`` seconds. After that they are no longer
+    served on normal lookups, but remain available through ``get_stale()``
+    until ``stale_ttl`` so a tool can fall back to the last known response
+    when OpenProject is temporarily failing.
+    
+    To keep a fetch that was already running from writing back data older
+    than an invalidation, take ``token()`` before fetching and pass it to
+    ``set()``; the write is skipped if the key was invalidated in between.
+    """
+
+    def __init__(self, ttl: float = 30.0, stale_ttl: float = 300.0, maxsize: int = 256):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        # key -> (fresh_until, stale_until, payload)
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, float, str]] = {}
+        # Bumped by every invalidate(); prefix -> counter value when last invalidated
+        self._generation = 0
+        self._invalidated: Dict[Tuple[Hashable, ...], int] = {}
+        # Tokens older than this count as invalidated (set when _invalidated is pruned)
+        self._floor = 0
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[str]:
+        """Return the cached payload if it is still fresh."""
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[2]
+        return None
+
+    def get_stale(self, key: Tuple[Hashable, ...]) -> Optional[str]:
+        """Return the cached payload if it is within the stale window."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry[1]:
+            del self._entries[key]
+            return None
+        return entry[2]
+
+    def token(self) -> int:
+        """Return a token marking the current point in the invalidation history."""
+        return self._generation
+    
+    def invalidated_since(self, key: Tuple[Hashable, ...], token: int) -> bool:
+        """Return True if ``key`` was invalidated after ``token`` was taken."""
+        if token < self._floor:
+            return True
+        return any(
+            self._invalidated.get(key[:size], -1) > token for size in range(len(key) + 1)
+        )
+    
+    def set(self, key: Tuple[Hashable, ...], payload: str, token: Optional[int] = None) -> str:
+        """Store a payload and return it.
+        
+        With a ``token``, the payload is only returned, not stored, if the key
+        was invalidated after the token was taken.
+        """
+        if token is not None and self.invalidated_since(key, token):
+            return payload
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            del self._entries[next(iter(self._entries))]
+        now = time.monotonic()
+        self._entries[key] = (now + self.ttl, now + self.stale_ttl, payload)
+        return payload
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """Drop all entries whose key starts with ``prefix`` (everything if empty)."""
+        self._generation += 1
+        if len(self._invalidated) >= self.maxsize:
+            self._invalidated.clear()
+            self._floor = self._generation
+        self._invalidated[prefix] = self._generation
+        if not prefix:
+            self._entries.clear()
+            return
+        size = len(prefix)
+        for key in [key for key in self._entries if key[:size] == prefix]:
+            del self._entries[key]
+
+
+class SingleFlight:
+    """Collapse concurrent identical async calls into a single execution.
+
+    While a call for a key is in flight, later callers with the same key await
+    the running task instead of starting their own. The key is released as
+    soon as the task finishes, so results are never reused across calls.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Task"] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn()`` for ``key`` or join the call already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        # Shield so one cancelled caller does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: "asyncio.Task") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
@@ -0,0 +1,21 @@
+"""Event loop setup for OpenProject MCP Server."""
+import asyncio
+
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+
+def install_uvloop() -> bool:
+    """Make uvloop the event loop implementation for new loops, when available.
+    
+    Must be called before the server starts its event loop (app.run()).
+    
+    Returns:
+        True if uvloop was installed, False if the default loop is kept
+    """
+    if uvloop is None:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
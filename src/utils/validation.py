@@ -1,11 +1,14 @@
 """Validation utilities for OpenProject MCP Server."""
 from typing import Any
 import re
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 import structlog
 
 logger = structlog.get_logger()
 
+_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+
 
 def validate_work_package_data(project_id: int, subject: str) -> None:
     """Validate basic work package creation data.
@@ -61,6 +64,32 @@ def validate_id(value: Any, field_name: str) -> None:
         raise ValueError(f"{field_name} must be a positive integer")
 
 
+@lru_cache(maxsize=2048)
+def is_valid_date_format(date_string: str) -> bool:
+    """Check that a date string is a real calendar date in YYYY-MM-DD format.
+    
+    Args:
+        date_string: Date string to check
+        
+    Returns:
+        True if the string is a valid date
+    """
+    match = _DATE_RE.fullmatch(date_string)
+    if not match:
+        return False
+    year, month, day = map(int, match.groups())
+    if not (year and 1 <= month <= 12 and 1 <= day <= 31):
+        return False
+    if day <= 28:
+        # Every month has at least 28 days; only month ends need the calendar
+        return True
+    try:
+        date.fromisoformat(date_string)
+    except ValueError:
+        return False
+    return True
+
+
 def validate_date_format(date_string: str, field_name: str = "date") -> None:
     """Validate date string format.
     
@@ -74,9 +103,7 @@ def validate_date_format(date_string: str, field_name: str = "date") -> None:
     if not date_string:
         return  # Optional dates can be empty
     
-    try:
-        datetime.strptime(date_string, "%Y-%m-%d")
-    except ValueError:
+    if not is_valid_date_format(date_string):
         raise ValueError(f"{field_name} must be in YYYY-MM-DD format")
 
 
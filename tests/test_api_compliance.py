@@ -1,8 +1,12 @@
 """API compliance tests for OpenProject MCP Server."""
 import pytest
 import json
+import asyncio
+import httpx
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.openproject_client import OpenProjectClient, OpenProjectAPIError
+from src.openproject_client import (
+    OpenProjectClient, OpenProjectAPIError, BULK_CREATE_CONCURRENCY, LOCK_VERSION_MAXSIZE
+)
 from src.models import WorkPackageCreateRequest, WorkPackageRelationCreateRequest
 from pydantic import ValidationError
 
@@ -114,6 +118,182 @@ class TestAPICompliance:
         assert all_projects[-1]["id"] == 150
         assert mock_client._make_request.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_pagination_capped_page_size(self, mock_client):
+        """Test pagination when the server caps pageSize below the request."""
+        def page(number):
+            ids = range((number - 1) * 20 + 1, min(number * 20, 50) + 1)
+            return {
+                "_embedded": {"elements": [{"id": i} for i in ids]},
+                "total": 50,
+                "count": len(ids),
+                "pageSize": 20,
+                "offset": number
+            }
+
+        mock_client._make_request.side_effect = lambda method, url, params: page(params["offset"])
+
+        all_projects = await mock_client.get_paginated_results("/projects")
+
+        assert [p["id"] for p in all_projects] == list(range(1, 51))
+        calls = mock_client._make_request.call_args_list
+        assert [call.kwargs["params"]["offset"] for call in calls] == [1, 2, 3]
+        assert [call.kwargs["params"]["pageSize"] for call in calls] == [100, 20, 20]
+
+    @pytest.mark.asyncio
+    async def test_select_paging_capped_page_size(self, mock_client):
+        """Test iterating a select= query when the server caps pageSize."""
+        def page(method, url, params):
+            assert params["select"] == "total,pageSize,elements/subject"
+            start = (params["offset"] - 1) * 50
+            # Without pageSize in the select list, only total would come back
+            return {
+                "_embedded": {"elements": [{"subject": str(i)} for i in range(start, min(start + 50, 150))]},
+                "total": 150
+            }
+
+        mock_client._make_request.side_effect = page
+
+        pages = [p async for p in mock_client.iter_work_packages(1, fields=["subject"])]
+
+        assert sum(len(p) for p in pages) == 150
+        calls = mock_client._make_request.call_args_list
+        assert [call.kwargs["params"]["offset"] for call in calls] == [1, 2, 3]
+        assert [call.kwargs["params"]["pageSize"] for call in calls] == [100, 50, 50]
+
+    @pytest.mark.asyncio
+    async def test_work_package_paging(self, mock_client):
+        """Test work package counting and page-by-page iteration."""
+        mock_client._make_request.return_value = {
+            "_embedded": {"elements": [{"id": 1}]},
+            "total": 42
+        }
+
+        assert await mock_client.count_work_packages(1) == 42
+        mock_client._make_request.assert_called_once_with(
+            "GET", "/projects/1/work_packages", params={"pageSize": 1}
+        )
+
+        mock_client._make_request.reset_mock()
+        mock_client._make_request.side_effect = [
+            {"_embedded": {"elements": [{"id": 1}, {"id": 2}]}, "total": 3},
+            {"_embedded": {"elements": [{"id": 3}]}, "total": 3}
+        ]
+
+        pages = [page async for page in mock_client.iter_work_packages(1, page_size=2)]
+
+        assert pages == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        # OpenProject's offset is a 1-based page number
+        offsets = [call.kwargs["params"]["offset"] for call in mock_client._make_request.call_args_list]
+        assert offsets == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_retry_on_rate_limit(self):
+        """Test that 429/503 responses are retried and validation errors are not."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(503),
+            httpx.Response(200, json={"id": 1}),
+            httpx.Response(422, json={"errors": {"subject": ["can't be blank"]}}),
+            httpx.Response(503)
+        ]
+        client = OpenProjectClient()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: responses.pop(0)))
+
+        try:
+            with patch("src.openproject_client.asyncio.sleep", new=AsyncMock()) as sleep:
+                assert await client._make_request("GET", "/projects/1") == {"id": 1}
+                assert sleep.await_args_list[0].args == (2.0,)
+                assert sleep.await_count == 2
+
+                with pytest.raises(OpenProjectAPIError) as exc_info:
+                    await client._make_request("POST", "/work_packages", json={})
+                assert exc_info.value.status_code == 422
+                assert sleep.await_count == 2
+
+                # Health probes make a single attempt
+                result = await client.test_connection()
+                assert result["success"] is False
+                assert sleep.await_count == 2
+                assert responses == []
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_partial_failure(self):
+        """Test bounded concurrency and per-item failures in bulk creation."""
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            subject = json.loads(request.content)["subject"]
+            if subject == "Task 3":
+                return httpx.Response(422, json={"errors": {"subject": ["is invalid"]}})
+            return httpx.Response(201, json={"id": int(subject.split()[1]), "subject": subject})
+
+        client = OpenProjectClient()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        work_packages = [
+            WorkPackageCreateRequest(subject=f"Task {i}", project_id=1)
+            for i in range(BULK_CREATE_CONCURRENCY * 2)
+        ]
+
+        try:
+            results = await client.bulk_create_work_packages(work_packages)
+        finally:
+            await client.close()
+
+        assert len(results) == len(work_packages)
+        assert isinstance(results[3], OpenProjectAPIError)
+        assert results[3].status_code == 422
+        assert [r["id"] for i, r in enumerate(results) if i != 3] == [
+            i for i in range(len(work_packages)) if i != 3
+        ]
+        assert 1 < peak <= BULK_CREATE_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_search_params(self, mock_client):
+        """Test the query parameters built for a work package search."""
+        mock_client._make_request.return_value = {"_embedded": {"elements": []}, "total": 0}
+
+        await mock_client.search_work_packages(
+            project_id=5,
+            status_ids=[1, 2],
+            due_before="2024-06-30",
+            subject_contains="login",
+            sort_by="dueDate",
+            sort_order="asc",
+            page_size=500,
+            offset=3,
+            fields=["subject"]
+        )
+
+        mock_client._make_request.assert_called_once()
+        args, kwargs = mock_client._make_request.call_args
+        assert args == ("GET", "/work_packages")
+        params = kwargs["params"]
+        assert params["pageSize"] == 100
+        assert params["offset"] == 3
+        assert params["select"] == "total,pageSize,elements/subject"
+        assert json.loads(params["sortBy"]) == [["dueDate", "asc"]]
+        assert json.loads(params["filters"]) == [
+            {"project": {"operator": "=", "values": ["5"]}},
+            {"status": {"operator": "=", "values": ["1", "2"]}},
+            {"dueDate": {"operator": "<>d", "values": ["1900-01-01", "2024-06-30"]}},
+            {"subject": {"operator": "~", "values": ["login"]}}
+        ]
+
+        # Unknown sort fields fall back to id, and no filters means no filters param
+        mock_client._make_request.reset_mock()
+        await mock_client.search_work_packages(sort_by="bogus")
+        params = mock_client._make_request.call_args.kwargs["params"]
+        assert json.loads(params["sortBy"]) == [["id", "desc"]]
+        assert "filters" not in params
+
     @pytest.mark.asyncio
     async def test_user_management(self, mock_client):
         """Test user management endpoints."""
@@ -145,6 +325,64 @@ class TestAPICompliance:
         user = await mock_client.get_user_by_id(1)
         assert user["id"] == 1
 
+    @pytest.mark.asyncio
+    async def test_bulk_user_lookup(self, mock_client):
+        """Test batched user lookup by email address."""
+        mock_client._make_request.return_value = {
+            "_embedded": {
+                "elements": [{"id": 1, "name": "John Doe", "email": "John@Example.com"}]
+            }
+        }
+
+        users = await mock_client.get_users_by_emails(
+            ["john@example.com", "JOHN@example.com", "jane@example.com"]
+        )
+
+        assert users == {
+            "john@example.com": {"id": 1, "name": "John Doe", "email": "John@Example.com"},
+            "jane@example.com": None
+        }
+        mock_client._make_request.assert_called_once()
+        args, kwargs = mock_client._make_request.call_args
+        assert args == ("GET", "/users")
+        assert json.loads(kwargs["params"]["filters"]) == [
+            {"email": {"operator": "=", "values": ["john@example.com", "jane@example.com"]}}
+        ]
+
+        # Found users are cached, misses are looked up again
+        mock_client._make_request.reset_mock()
+        mock_client._make_request.return_value = {"_embedded": {"elements": []}}
+        users = await mock_client.get_users_by_emails(["john@example.com", "jane@example.com"])
+        assert users["john@example.com"]["id"] == 1
+        assert users["jane@example.com"] is None
+        filters = json.loads(mock_client._make_request.call_args.kwargs["params"]["filters"])
+        assert filters[0]["email"]["values"] == ["jane@example.com"]
+
+    @pytest.mark.asyncio
+    async def test_metadata_revalidation(self):
+        """Test that metadata collections are revalidated with their ETag."""
+        body = {"_embedded": {"elements": [{"id": 1, "name": "Task"}]}}
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=body, headers={"ETag": '"v1"'})
+
+        client = OpenProjectClient()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        try:
+            assert await client._make_request("GET", "/types") == body
+            assert await client._make_request("GET", "/types") == body
+            # Other paths are not revalidated
+            await client._make_request("GET", "/projects")
+        finally:
+            await client.close()
+
+        assert seen == [None, '"v1"', None]
+
     @pytest.mark.asyncio
     async def test_caching_functionality(self, mock_client):
         """Test caching layer functionality."""
@@ -169,6 +407,64 @@ class TestAPICompliance:
         assert mock_client._fetch_work_package_types.call_count == 1  # Not called again
         assert types1 == types2
 
+    @pytest.mark.asyncio
+    async def test_cache_coalescing_and_expiry(self, mock_client):
+        """Test that concurrent misses share one fetch and entries expire."""
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return [{"id": calls}]
+
+        results = await asyncio.gather(
+            *(mock_client.get_cached_or_fetch("statuses", fetch) for _ in range(5))
+        )
+        assert calls == 1
+        assert all(result == [{"id": 1}] for result in results)
+
+        with patch("src.openproject_client.time") as mock_time:
+            mock_time.monotonic.return_value = 1000.0
+            mock_client._set_cached("statuses", [{"id": 1}])
+
+            mock_time.monotonic.return_value = 1000.0 + mock_client._cache_ttl - 1
+            assert await mock_client.get_cached_or_fetch("statuses", fetch) == [{"id": 1}]
+            assert calls == 1
+
+            mock_time.monotonic.return_value = 1000.0 + mock_client._cache_ttl
+            assert await mock_client.get_cached_or_fetch("statuses", fetch) == [{"id": 2}]
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_update_lock_version_conflict(self, mock_client):
+        """Test that a stale lockVersion is refreshed and the update retried."""
+        mock_client._lock_versions[7] = 1
+        mock_client._make_request.side_effect = [
+            OpenProjectAPIError("Conflict", status_code=409),
+            {"id": 7, "lockVersion": 2},
+            {"id": 7, "lockVersion": 3, "subject": "Updated"}
+        ]
+
+        result = await mock_client.update_work_package(7, {"subject": "Updated"})
+
+        assert result["subject"] == "Updated"
+        calls = mock_client._make_request.call_args_list
+        assert calls[0].args == ("PATCH", "/work_packages/7")
+        assert calls[0].kwargs["json"] == {"subject": "Updated", "lockVersion": 1}
+        assert calls[1].args == ("GET", "/work_packages/7")
+        assert calls[2].kwargs["json"] == {"subject": "Updated", "lockVersion": 2}
+        assert mock_client._lock_versions[7] == 3
+
+    def test_lock_versions_bounded(self, mock_client):
+        """Test that remembered lockVersions are capped, oldest first."""
+        for wp_id in range(LOCK_VERSION_MAXSIZE + 10):
+            mock_client._remember_lock_version({"id": wp_id, "lockVersion": 0})
+
+        assert len(mock_client._lock_versions) == LOCK_VERSION_MAXSIZE
+        assert 0 not in mock_client._lock_versions
+        assert LOCK_VERSION_MAXSIZE + 9 in mock_client._lock_versions
+
     def test_validation_models(self):
         """Test Pydantic validation models."""
         # Test valid work package creation
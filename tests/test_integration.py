@@ -11,7 +11,12 @@ from src.mcp_server import (
     get_work_package_types,
     get_work_package_statuses,
     get_priorities,
-    create_work_package_dependency
+    create_work_package_dependency,
+    create_work_packages,
+    get_projects,
+    team_workload_analysis,
+    _fetch_project_summary,
+    _response_cache
 )
 
 
@@ -268,6 +273,207 @@ class TestOpenProjectIntegration:
             # Verify API call
             mock_create_relation.assert_called_once_with(1, 2, "follows", "Task B follows Task A", 2)
 
+    @pytest.mark.asyncio
+    async def test_create_work_packages_workflow(self):
+        """Test bulk work package creation with invalid and rejected items."""
+        from src.openproject_client import OpenProjectAPIError
+        
+        with patch.object(openproject_client, 'bulk_create_work_packages', new_callable=AsyncMock) as mock_bulk:
+            mock_bulk.return_value = [
+                {"id": 10, "subject": "Design"},
+                OpenProjectAPIError("Validation failed", status_code=422)
+            ]
+            
+            result = await create_work_packages([
+                {"project_id": 1, "subject": "Design"},
+                {"project_id": 1, "subject": "Build", "start_date": "2024-02-01", "due_date": "2024-01-01"},
+                {"project_id": 1, "subject": "Test"}
+            ])
+            result_data = json.loads(result)
+            
+            assert result_data["success"] is False
+            assert result_data["message"] == "Created 1 of 3 work packages"
+            results = result_data["results"]
+            assert results[0]["work_package"]["id"] == 10
+            assert results[1]["error"] == "Validation error"
+            assert "Validation failed" in results[2]["error"]
+            
+            # Only the valid work packages are sent
+            sent = mock_bulk.call_args.args[0]
+            assert [wp.subject for wp in sent] == ["Design", "Test"]
+
+    @pytest.mark.asyncio
+    async def test_stale_response_on_error(self):
+        """Test that an expired response is served while OpenProject fails."""
+        # The exception class as seen by the server module
+        from src.mcp_server import OpenProjectAPIError
+        
+        _response_cache.invalidate("get_projects")
+        projects = [{"id": 1, "name": "Test Project", "identifier": "test"}]
+        
+        with patch.object(openproject_client, 'get_projects', new_callable=AsyncMock) as mock_get_projects, \
+             patch("utils.cache.time") as mock_time:
+            mock_get_projects.return_value = projects
+            mock_time.monotonic.return_value = 1000.0
+            fresh = json.loads(await get_projects())
+            assert fresh["success"] is True
+            assert "cache" not in fresh
+            
+            # Fresh entry expired, OpenProject failing: serve the stale copy
+            mock_get_projects.side_effect = OpenProjectAPIError("Service unavailable", status_code=503)
+            mock_time.monotonic.return_value = 1000.0 + _response_cache.ttl + 1
+            stale = json.loads(await get_projects())
+            assert stale["cache"] == "stale"
+            assert stale["projects"] == fresh["projects"]
+            assert mock_get_projects.await_count == 2
+            
+            # Errors that are not outages are reported, not masked
+            mock_get_projects.side_effect = OpenProjectAPIError("Unauthorized", status_code=401)
+            result = json.loads(await get_projects())
+            assert result["success"] is False
+            assert "Unauthorized" in result["error"]
+            
+            # Past the stale window the error is reported
+            mock_get_projects.side_effect = OpenProjectAPIError("Service unavailable", status_code=503)
+            mock_time.monotonic.return_value = 1000.0 + _response_cache.stale_ttl
+            result = json.loads(await get_projects())
+            assert result["success"] is False
+            assert "Service unavailable" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch(self):
+        """Test that a fetch started before an invalidation is not cached."""
+        _response_cache.invalidate("get_projects")
+        release = asyncio.Event()
+        names = iter(["Old Project", "New Project"])
+        
+        async def slow_get_projects():
+            name = next(names)
+            await release.wait()
+            return [{"id": 1, "name": name, "identifier": "p"}]
+        
+        with patch.object(openproject_client, 'get_projects', new=slow_get_projects):
+            before = asyncio.ensure_future(get_projects())
+            await asyncio.sleep(0)
+            
+            # e.g. create_project finishing while the listing is in flight
+            _response_cache.invalidate("get_projects")
+            after = asyncio.ensure_future(get_projects())
+            await asyncio.sleep(0)
+            release.set()
+            
+            # The later call did not join the fetch started before the invalidation
+            assert json.loads(await before)["projects"][0]["name"] == "Old Project"
+            assert json.loads(await after)["projects"][0]["name"] == "New Project"
+        
+        # Only the fetch started after the invalidation is cached
+        cached = json.loads(_response_cache.get(("get_projects",)))
+        assert cached["projects"][0]["name"] == "New Project"
+        _response_cache.invalidate("get_projects")
+
+    @pytest.mark.asyncio
+    async def test_project_summary_reports_original_error(self):
+        """Test that a failing project lookup does not mask the work package error."""
+        def failing_pages(project_id, fields=None):
+            async def pages():
+                raise RuntimeError("work packages unavailable")
+                yield []
+            return pages()
+        
+        with patch.object(openproject_client, 'iter_work_packages', new=failing_pages), \
+             patch.object(openproject_client, 'get_project_by_id', new_callable=AsyncMock) as mock_get_project:
+            mock_get_project.side_effect = RuntimeError("project unavailable")
+            with pytest.raises(RuntimeError, match="work packages unavailable"):
+                await _fetch_project_summary(1)
+            
+            # A missing project is not an error
+            mock_get_project.side_effect = None
+            mock_get_project.return_value = None
+            assert await _fetch_project_summary(1) == (None, {}, [])
+
+    @pytest.mark.asyncio
+    async def test_team_workload_counters(self):
+        """Test the filters sent for each grouped workload counter."""
+        mock_statuses = [
+            {"id": 1, "name": "New"},
+            {"id": 7, "name": "In progress"},
+            {"id": 12, "name": "Closed"}
+        ]
+        analysis = getattr(team_workload_analysis, "fn", team_workload_analysis)
+        
+        with patch.object(openproject_client, 'get_work_package_statuses', new_callable=AsyncMock) as mock_get_statuses, \
+             patch.object(openproject_client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_get_statuses.return_value = mock_statuses
+            mock_request.return_value = {"groups": [{"value": "John Doe", "count": 3}]}
+            
+            await analysis(project_ids=[1])
+            
+            # One query per counter: total, overdue, in progress, completed
+            filters = [
+                json.loads(call.kwargs["params"]["filters"])
+                for call in mock_request.call_args_list
+            ]
+            assert all(call.kwargs["params"]["groupBy"] == "assignee" for call in mock_request.call_args_list)
+        
+        open_filter = {"status": {"operator": "o", "values": []}}
+        assert len(filters) == 4
+        assert filters[0] == []
+        assert filters[1][0] == open_filter
+        assert filters[1][1]["dueDate"]["operator"] == "<>d"
+        assert filters[2] == [{"status": {"operator": "=", "values": ["7"]}}]
+        assert filters[3] == [{"status": {"operator": "=", "values": ["12"]}}]
+
+    @pytest.mark.asyncio
+    async def test_team_workload_consistent_counts(self):
+        """Test that every workload counter counts within the same work packages."""
+        mock_statuses = [
+            {"id": 1, "name": "New", "isClosed": False},
+            {"id": 7, "name": "In progress", "isClosed": False},
+            {"id": 12, "name": "Closed", "isClosed": True}
+        ]
+        closed = {12}
+        # (assignee, status id, overdue)
+        work_packages = [
+            ("John Doe", 1, True),
+            ("John Doe", 7, False),
+            ("John Doe", 12, True),
+            ("Jane Roe", 12, False)
+        ]
+        
+        def grouped_count(method, url, params):
+            matches = work_packages
+            for condition in json.loads(params["filters"]):
+                if "dueDate" in condition:
+                    matches = [wp for wp in matches if wp[2]]
+                elif condition["status"]["operator"] == "o":
+                    matches = [wp for wp in matches if wp[1] not in closed]
+                else:
+                    ids = {int(v) for v in condition["status"]["values"]}
+                    matches = [wp for wp in matches if wp[1] in ids]
+            counts = {}
+            for assignee, _, _ in matches:
+                counts[assignee] = counts.get(assignee, 0) + 1
+            return {"groups": [{"value": name, "count": count} for name, count in counts.items()]}
+        
+        analysis = getattr(team_workload_analysis, "fn", team_workload_analysis)
+        with patch.object(openproject_client, 'get_work_package_statuses', new_callable=AsyncMock) as mock_get_statuses, \
+             patch.object(openproject_client, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_get_statuses.return_value = mock_statuses
+            mock_request.side_effect = grouped_count
+            messages = await analysis(project_ids=[1])
+        
+        content = messages[0]["content"]
+        breakdown = content.split("Team workload breakdown:\n", 1)[1].split("\n\nPlease provide", 1)[0]
+        workload = json.loads(breakdown)
+        
+        assert workload["John Doe"]["total_tasks"] == 3
+        assert workload["John Doe"]["overdue"] == 1
+        assert workload["Jane Roe"]["total_tasks"] == 1
+        assert workload["Jane Roe"]["projects"] == [1]
+        for entry in workload.values():
+            assert entry["completed"] <= entry["total_tasks"]
+            assert entry["in_progress"] <= entry["total_tasks"]
+
     @pytest.mark.asyncio
     async def test_validation_error_handling(self):
         """Test validation error handling in integration workflow."""